@@ -192,15 +192,15 @@ def get_all_covered_effects():
 
 def get_missing_effects():
     """Get effects that are not covered by the registry."""
-    covered = set(COMPREHENSIVE_TRAINER_EFFECTS.keys())
-    all_effects = set(ALL_EFFECTS)
-    return all_effects - covered
+    # Dict key views support set difference directly, without copying the keys
+    return set(ALL_EFFECTS) - COMPREHENSIVE_TRAINER_EFFECTS.keys()
 
 def print_coverage_stats():
     """Print statistics about effect coverage."""
     covered = len(COMPREHENSIVE_TRAINER_EFFECTS)
     total = len(ALL_EFFECTS)
-    missing = len(get_missing_effects())
+    missing_effects = get_missing_effects()
+    missing = len(missing_effects)
     
     print(f"📊 Trainer Effect Coverage:")
     print(f"   Total effects: {total}")
@@ -210,7 +210,7 @@ def print_coverage_stats():
     
     if missing > 0:
         print(f"\n❌ Missing effects:")
-        for effect in get_missing_effects():
+        for effect in missing_effects:
             print(f"   - {effect}")
 
 if __name__ == "__main__":
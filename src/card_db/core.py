@@ -5,11 +5,16 @@ All classes use frozen dataclasses to ensure immutability.
 """
 
 from __future__ import annotations
+import os
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Set
 from src.rules.constants import EnergyType, Stage, StatusCondition, GameConstants
 
-@dataclass(frozen=True)
+# Set POKEMON_SKIP_VALIDATION=1 to skip PokemonCard field checks when building
+# many cards from already-validated data (e.g. bulk simulation). Off by default.
+_SKIP_VALIDATION = os.environ.get("POKEMON_SKIP_VALIDATION") == "1"
+
+@dataclass(frozen=True, slots=True)
 class Effect:
     """Represents a card effect."""
     effect_type: str
@@ -20,7 +25,7 @@ class Effect:
     parameters: Dict[str, Any] = field(default_factory=dict)
     requires_coin_flip: bool = False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Attack:
     """Represents a Pokemon attack."""
     name: str
@@ -42,7 +47,7 @@ class Attack:
                 return False
         return True
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Ability:
     """Represents a Pokemon ability."""
     name: str
@@ -50,7 +55,7 @@ class Ability:
     is_passive: bool  # True for always-on effects, False for activated abilities
     effects: List[Effect] = field(default_factory=list)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Card:
     """Base class for all cards."""
     id: str  # Set code + number (e.g., "SWSH1-123")
@@ -61,7 +66,7 @@ class Card:
         """Points awarded when knocked out."""
         return 0  # Base cards award no points
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PokemonCard(Card):
     """Represents a Pokemon card."""
     pokemon_type: EnergyType
@@ -84,6 +89,8 @@ class PokemonCard(Card):
 
     def __post_init__(self):
         """Validate Pokemon card."""
+        if _SKIP_VALIDATION:
+            return
         if not self.pokemon_type:
             raise ValueError("Pokemon must have a type")
         if self.hp <= 0:
@@ -128,25 +135,25 @@ class PokemonCard(Card):
             return amount + GameConstants.WEAKNESS_BONUS
         return amount
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrainerCard(Card):
     """Base class for trainer cards."""
     effects: List[Effect]
     text: str  # Card text/description
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ItemCard(TrainerCard):
     """Item card that can be played any time during Action Phase.
     No limit on number played per turn.
     """
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SupporterCard(TrainerCard):
     """Supporter card limited to one per turn."""
     pass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCard(TrainerCard):
     """Tool card that attaches to Pokemon.
     Only one tool can be attached to a Pokemon at a time.
@@ -13,15 +13,36 @@ This module handles storing and retrieving card data in a structured format:
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.card_db.core import Card, PokemonCard, ItemCard
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder/decoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _dumps(data: Dict) -> bytes:
+    """Encode data as indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(blob: bytes) -> Dict:
+    """Decode JSON bytes; raises ValueError on invalid input."""
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
 class CardStorage:
     """Handles storage and retrieval of card data."""
     
@@ -33,63 +54,103 @@ class CardStorage:
         # Create directories if they don't exist
         self.sets_dir.mkdir(parents=True, exist_ok=True)
         self.cards_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Parsed set/card data keyed by id; filled on first read and on write
+        self._set_cache: Dict[str, Dict] = {}
+        self._card_cache: Dict[str, Dict] = {}
+        
+        # Directory listings keyed by directory, with the mtime they were read at.
+        # Writes drop the listing too: a coarse mtime may not change between them.
+        self._listing_cache: Dict[Path, Tuple[int, List[str]]] = {}
+    
+    def _write_json(self, path: Path, data: Dict) -> None:
+        """Serialize data up front and write it with a single unbuffered write."""
+        blob = _dumps(data)
+        with open(path, "wb", buffering=0) as f:
+            f.write(blob)
     
     def store_set(self, set_id: str, set_data: Dict) -> None:
         """Store set data in JSON format."""
-        path = self.sets_dir / f"{set_id}.json"
-        with open(path, "w") as f:
-            json.dump(set_data, f, indent=2)
+        self._write_json(self.sets_dir / f"{set_id}.json", set_data)
+        # Write-through: a following get_set is served without re-reading the file
+        self._set_cache[set_id] = copy.deepcopy(set_data)
+        self._listing_cache.pop(self.sets_dir, None)
     
     def store_card(self, card_id: str, card: Card) -> None:
         """Store individual card data in JSON format."""
-        path = self.cards_dir / f"{card_id}.json"
-        with open(path, "w") as f:
-            json.dump(card.to_dict(), f, indent=2)
+        data = card.to_dict()
+        self._write_json(self.cards_dir / f"{card_id}.json", data)
+        self._card_cache[card_id] = data
+        self._listing_cache.pop(self.cards_dir, None)
+    
+    def store_cards(self, cards: Dict[str, Dict]) -> None:
+        """Store many cards at once.
+        
+        Takes already-serialized card data keyed by card id, in the same
+        shape get_card returns, and writes one JSON file per card.
+        """
+        for card_id, data in cards.items():
+            self._write_json(self.cards_dir / f"{card_id}.json", data)
+        self._card_cache.update((card_id, copy.deepcopy(data)) for card_id, data in cards.items())
+        self._listing_cache.pop(self.cards_dir, None)
+    
+    def _read_json(self, path: Path, kind: str) -> Optional[Dict]:
+        """Read and parse a JSON file in one open/read, or None if missing or invalid."""
+        try:
+            blob = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return _loads(blob)
+        except ValueError:  # json and orjson decode errors both subclass it
+            logger.warning(f"Invalid JSON in {kind} file: {path}")
+            return None
+    
+    def _cached_read(self, cache: Dict[str, Dict], key: str, path: Path, kind: str) -> Optional[Dict]:
+        """Return a copy of the cached data for key, reading it from disk on a miss."""
+        data = cache.get(key)
+        if data is None:
+            data = self._read_json(path, kind)
+            if data is None:
+                return None  # Misses are not cached; the file may appear later
+            cache[key] = data
+        return copy.deepcopy(data)
     
     def get_set(self, set_id: str) -> Optional[Dict]:
         """Retrieve set data."""
-        path = self.sets_dir / f"{set_id}.json"
-        if path.exists():
-            try:
-                with open(path) as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON in set file: {path}")
-                return None
-        return None
+        return self._cached_read(self._set_cache, set_id, self.sets_dir / f"{set_id}.json", "set")
     
     def get_card(self, card_id: str) -> Optional[Dict]:
         """Retrieve card data."""
-        path = self.cards_dir / f"{card_id}.json"
-        if path.exists():
-            try:
-                with open(path) as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON in card file: {path}")
-                return None
-        return None
+        return self._cached_read(self._card_cache, card_id, self.cards_dir / f"{card_id}.json", "card")
+    
+    def _list_ids(self, directory: Path) -> List[str]:
+        """List the ids of the JSON files in directory, rescanning only when its mtime changes."""
+        mtime = directory.stat().st_mtime_ns
+        cached = self._listing_cache.get(directory)
+        if cached is None or cached[0] != mtime:
+            ids = [p.stem for p in directory.iterdir() if p.suffix == ".json"]
+            cached = self._listing_cache[directory] = (mtime, ids)
+        return list(cached[1])
     
     def list_sets(self) -> List[str]:
         """List all available sets."""
-        return [p.stem for p in self.sets_dir.glob("*.json")]
+        return self._list_ids(self.sets_dir)
     
     def list_cards(self) -> List[str]:
         """List all available cards."""
-        return [p.stem for p in self.cards_dir.glob("*.json")] 
+        return self._list_ids(self.cards_dir)
 
     def load_card(self, card_id: str) -> Optional[Card]:
         """Load a card from storage by ID."""
-        card_path = self.cards_dir / f"{card_id}.json"
-        if not card_path.exists():
+        data = self.get_card(card_id)
+        if data is None:
             return None
             
-        with open(card_path, 'r') as f:
-            data = json.load(f)
-            # Reconstruct the appropriate card type
-            if data.get("card_type") == "Item":
-                return ItemCard(**data)
-            elif "hp" in data:  # It's a Pokemon card
-                return PokemonCard(**data)
-            else:
-                return Card(**data) 
\ No newline at end of file
+        # Reconstruct the appropriate card type
+        if data.get("card_type") == "Item":
+            return ItemCard(**data)
+        elif "hp" in data:  # It's a Pokemon card
+            return PokemonCard(**data)
+        else:
+            return Card(**data)
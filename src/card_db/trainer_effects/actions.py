@@ -1,6 +1,7 @@
 """Action functions for trainer effects."""
 
 import dataclasses
+import random
 from typing import List, Callable, Optional, Any, Dict
 from .context import EffectContext
 from src.card_db.core import EnergyType, PokemonCard, Stage, Attack, Ability, PlayerTag, StatusCondition, Effect
@@ -83,7 +84,7 @@ def switch_opponent_active(ctx: EffectContext) -> EffectContext:
 
 def return_to_hand(ctx: EffectContext, target_player: str = "player") -> EffectContext:
     """Return selected Pokemon to hand."""
-    selected = ctx.data.get('selected_target')
+    selected = ctx.selected_target
     target = ctx.opponent if target_player == "opponent" else ctx.player
     
     if not selected:
@@ -113,12 +114,15 @@ def heal_pokemon(ctx: EffectContext, amount: int) -> EffectContext:
             return ctx
     
     selected = ctx.targets[0]
+    if not selected.damage_counters:
+        # Nothing to heal; skip rebuilding the Pokemon and game state
+        return ctx
     new_damage = max(0, selected.damage_counters - amount)
     new_pokemon = dataclasses.replace(selected, damage_counters=new_damage)
     
     # Update the Pokemon in the game state
     new_player = None
-    if selected == ctx.player.active_pokemon:
+    if selected is ctx.player.active_pokemon or selected == ctx.player.active_pokemon:
         new_player = dataclasses.replace(ctx.player, active_pokemon=new_pokemon)
     elif selected in ctx.player.bench:
         new_bench = [new_pokemon if p == selected else p for p in ctx.player.bench]
@@ -179,26 +183,24 @@ def attach_energy_from_zone(ctx: EffectContext, energy_type: EnergyType) -> Effe
 
 def attach_energy_from_discard(ctx: EffectContext, energy_type: EnergyType, amount: int = 1) -> EffectContext:
     """Attach energy from discard pile to selected Pokemon."""
-    selected = ctx.data.get('selected_target')
+    selected = ctx.selected_target
     if not selected:
         ctx = dataclasses.replace(ctx, failed=True)
         return ctx
     
     # Find energy cards in discard pile (in TCG Pocket, energy comes from Energy Zone)
     # This is for special cards like Volkner that attach from discard
-    attached_count = 0
-    for _ in range(amount):
-        # For now, simulate having energy available
-        selected.attached_energies.append(energy_type)
-        attached_count += 1
-        print(f"Attached {energy_type.value} energy from discard to {selected.name}")
+    # For now, simulate having energy available
+    if amount > 0:
+        selected.attached_energies.extend([energy_type] * amount)
+        print(f"Attached {amount} {energy_type.value} energy from discard to {selected.name}")
     
     return ctx
 
 def move_energy_between_pokemon(ctx: EffectContext) -> EffectContext:
     """Move energy from one Pokemon to another."""
     source = ctx.data.get('source_pokemon')
-    target = ctx.data.get('selected_target')
+    target = ctx.selected_target
     
     if not source or not target:
         ctx = dataclasses.replace(ctx, failed=True)
@@ -233,23 +235,20 @@ def coin_flip_repeat(ctx: EffectContext, effect_fn: Callable) -> EffectContext:
     
     return ctx
 
-def damage_bonus_this_turn(ctx: EffectContext, amount: int, pokemon_names: List[str] = None) -> EffectContext:
+def damage_bonus_this_turn(ctx: EffectContext, amount: int, pokemon_names: Optional[List[str]] = None) -> EffectContext:
     """Give damage bonus to attacks this turn."""
-    # Store the bonus in game state (you'd need to add this to GameState)
-    if not hasattr(ctx.game_state, 'damage_bonuses'):
-        ctx.game_state.damage_bonuses = {}
-    
+    bonuses = ctx.game_state.damage_bonuses
     if pokemon_names:
         for name in pokemon_names:
-            ctx.game_state.damage_bonuses[name] = amount
+            bonuses[name] = amount
         print(f"Attacks by {', '.join(pokemon_names)} do +{amount} damage this turn")
     else:
-        ctx.game_state.damage_bonuses['all'] = amount
+        bonuses['all'] = amount
         print(f"All attacks do +{amount} damage this turn")
     
     return ctx
 
-def search_deck_for_pokemon(ctx: EffectContext, pokemon_names: List[str] = None) -> EffectContext:
+def search_deck_for_pokemon(ctx: EffectContext, pokemon_names: Optional[List[str]] = None) -> EffectContext:
     """Search deck for specific Pokemon and put in hand."""
     available_pokemon = [card for card in ctx.player.deck 
                         if isinstance(card, PokemonCard)]
@@ -272,18 +271,21 @@ def search_deck_for_pokemon(ctx: EffectContext, pokemon_names: List[str] = None)
 
 def shuffle_hand_into_deck_and_draw(ctx: EffectContext, draw_count: int) -> EffectContext:
     """Shuffle hand into deck and draw new cards."""
+    deck, hand = ctx.player.deck, ctx.player.hand
+    
     # Move hand to deck
-    ctx.player.deck.extend(ctx.player.hand)
-    ctx.player.hand.clear()
+    deck.extend(hand)
+    hand.clear()
     
-    # Shuffle deck (simulate)
-    import random
-    random.shuffle(ctx.player.deck)
+    # Shuffle deck with the engine's RNG so seeded games stay reproducible
+    rng = ctx.game_engine.rng if ctx.game_engine is not None else random
+    rng.shuffle(deck)
     
-    # Draw new cards
-    for _ in range(min(draw_count, len(ctx.player.deck))):
-        if ctx.player.deck:
-            ctx.player.hand.append(ctx.player.deck.pop())
+    # Draw new cards off the top of the deck in one slice
+    take = min(draw_count, len(deck))
+    if take > 0:
+        hand.extend(reversed(deck[-take:]))
+        del deck[-take:]
     
     print(f"Shuffled hand into deck and drew {len(ctx.player.hand)} cards")
     return ctx
@@ -301,7 +303,7 @@ def draw_cards(ctx: EffectContext, count: int) -> EffectContext:
 
 def attach_energy_from_zone_coin_flip(ctx: EffectContext, energy_type: EnergyType) -> EffectContext:
     """Attach energy based on coin flips until tails. For each heads, attach one energy."""
-    selected = ctx.data.get('selected_target')
+    selected = ctx.selected_target
     if not selected:
         ctx = dataclasses.replace(ctx, failed=True)
         return ctx
@@ -339,23 +341,27 @@ def attach_tool_card(ctx: EffectContext) -> EffectContext:
         # If no targets, try to use active Pokemon
         ctx = dataclasses.replace(ctx, targets=[ctx.player.active_pokemon])
         if not ctx.targets[0]:
-            return dataclasses.replace(ctx, failed=True)
+            ctx.failed = True
+            return ctx
     
     selected = ctx.targets[0]
     tool_card = ctx.data.get('tool_card')
     
     if not tool_card:
         print("No tool card provided")
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
     
     if not isinstance(tool_card, ToolCard):
         print(f"Not a tool card: {type(tool_card)}")  # Add more debug info
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
     
     # Check if Pokemon already has a tool
     if hasattr(selected, 'attached_tool') and selected.attached_tool:
         print("Pokemon already has a tool")
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
         
     # Attach the tool
     new_pokemon = dataclasses.replace(selected, attached_tool=tool_card)
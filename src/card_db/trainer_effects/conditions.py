@@ -1,6 +1,6 @@
 """Condition functions for trainer effects."""
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 from .context import EffectContext
 from src.card_db.core import PokemonCard, EnergyType, Stage
 import dataclasses
@@ -62,7 +62,7 @@ def require_active_pokemon(ctx: EffectContext, target_player: str = "player") ->
         ctx.targets = [target.active_pokemon]
     return ctx
 
-def require_pokemon_in_discard(ctx: EffectContext, pokemon_names: List[str] = None) -> EffectContext:
+def require_pokemon_in_discard(ctx: EffectContext, pokemon_names: Optional[List[str]] = None) -> EffectContext:
     """Require specific Pokemon in discard pile."""
     pokemon_in_discard = [card for card in ctx.player.discard_pile 
                          if isinstance(card, PokemonCard)]
@@ -1,18 +1,28 @@
 """Context object for trainer effect execution."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from src.card_db.core import PokemonCard
 from src.rules.game_state import GameState, PlayerState
 from src.rules.game_engine import GameEngine
 import dataclasses
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class EffectContext:
-    """Context for executing trainer effects."""
+    """Context for executing trainer effects.
+    
+    Hot values read by most effects are slotted attributes; ``data`` is
+    kept for rarely used, effect-specific values.
+    """
     game_state: 'GameState'
     player: 'PlayerState'
     opponent: 'PlayerState'
     game_engine: 'GameEngine'
     targets: List[Any] = dataclasses.field(default_factory=list)
     data: Dict[str, Any] = dataclasses.field(default_factory=dict)
-    failed: bool = False
\ No newline at end of file
+    failed: bool = False
+    selected_target: Optional[PokemonCard] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether no effect in the chain has failed so far."""
+        return not self.failed
@@ -1,5 +1,6 @@
 """Selection functions for trainer effects."""
 
+import random
 from typing import List
 from .context import EffectContext
 from src.card_db.core import PokemonCard
@@ -34,12 +35,13 @@ def opponent_chooses_target(ctx: EffectContext) -> EffectContext:
 
 def random_target(ctx: EffectContext) -> EffectContext:
     """Choose a random target Pokemon."""
-    import random
     available = [ctx.player.active_pokemon] + ctx.player.bench if ctx.player.active_pokemon else ctx.player.bench
     if not available:
         ctx.failed = True
         return ctx
-    ctx.targets = [random.choice(available)]
+    # Use the engine's RNG so seeded games stay reproducible
+    rng = ctx.game_engine.rng if ctx.game_engine is not None else random
+    ctx.targets = [rng.choice(available)]
     return ctx
 
 def all_targets(ctx: EffectContext) -> EffectContext:
@@ -64,7 +66,7 @@ def set_target_to_active(ctx: EffectContext) -> EffectContext:
 
 def switch_opponent_active(ctx: EffectContext) -> EffectContext:
     """Switch opponent's active Pokemon with selected benched Pokemon."""
-    selected = ctx.data.get('selected_target')
+    selected = ctx.selected_target
     if not selected or selected not in ctx.opponent.bench:
         ctx.failed = True
         return ctx
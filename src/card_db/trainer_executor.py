@@ -1,12 +1,63 @@
 """Execute trainer card effect chains."""
 
+from typing import Callable, Dict, List, Optional, Tuple
+
 from src.card_db.trainer_effects import EffectContext
+from src.card_db.trainer_effects.actions import attach_tool_card
 from src.card_db.comprehensive_trainer_registry import TRAINER_EFFECTS, get_effect_for_card
-from src.card_db.core import TrainerCard, ItemCard, ToolCard, SupporterCard
+from src.card_db.core import Card, TrainerCard, ItemCard, ToolCard, SupporterCard
 from src.rules.game_state import GameState, PlayerState
 
-def execute_trainer_card(card: TrainerCard, game_state: GameState, player: PlayerState, game_engine=None) -> bool:
-    """Execute a trainer card's effects."""
+EffectFn = Callable[[EffectContext], EffectContext]
+
+# Tool cards always run the same chain
+_TOOL_CHAIN: Tuple[EffectFn, ...] = (attach_tool_card,)
+
+# Effect chains resolved from the registry, keyed by card name
+_CHAIN_CACHE: Dict[str, Tuple[EffectFn, ...]] = {}
+
+def _resolve_chain(
+    card: TrainerCard,
+    effects_registry: Dict[str, List[EffectFn]],
+    get_effect: Callable[[str], Optional[str]]
+) -> Tuple[EffectFn, ...]:
+    """Look up a card's effect chain by its effect text, falling back to its name."""
+    effect_text = get_effect(card.name)
+    return tuple(effects_registry.get(effect_text if effect_text else card.name) or ())
+
+def _get_effect_chain(card: TrainerCard) -> Tuple[EffectFn, ...]:
+    """Resolve a card's effect chain on first use and reuse it afterwards."""
+    chain = _CHAIN_CACHE.get(card.name)
+    if chain is None:
+        chain = _CHAIN_CACHE[card.name] = _resolve_chain(card, TRAINER_EFFECTS, get_effect_for_card)
+    return chain
+
+def _remove_from_hand(hand: List[Card], card: Card) -> None:
+    """Remove card from hand, matching by identity before falling back to equality."""
+    for i, held in enumerate(hand):
+        if held is card:
+            del hand[i]
+            return
+    # Callers may pass an equal copy of the card rather than the one in hand
+    try:
+        hand.remove(card)
+    except ValueError:
+        pass
+
+def execute_trainer_card(
+    card: TrainerCard,
+    game_state: GameState,
+    player: PlayerState,
+    game_engine=None,
+    *,
+    effects_registry: Optional[Dict[str, List[EffectFn]]] = None,
+    get_effect: Optional[Callable[[str], Optional[str]]] = None
+) -> bool:
+    """Execute a trainer card's effects.
+    
+    effects_registry and get_effect replace TRAINER_EFFECTS and
+    get_effect_for_card for this call; chains resolved from them are not cached.
+    """
     # Create initial context
     ctx = EffectContext(
         game_state=game_state,
@@ -18,31 +69,31 @@ def execute_trainer_card(card: TrainerCard, game_state: GameState, player: Playe
     )
     
     # Get effect chain
-    effect_chain = None
     if isinstance(card, ToolCard):
-        from src.card_db.trainer_effects.actions import attach_tool_card
-        effect_chain = [attach_tool_card]  # Directly use attach_tool_card for tool cards
+        effect_chain = _TOOL_CHAIN
+    elif effects_registry is None and get_effect is None:
+        effect_chain = _get_effect_chain(card)
     else:
-        effect_text = get_effect_for_card(card.name)
-        if effect_text:
-            effect_chain = TRAINER_EFFECTS.get(effect_text)
-        else:
-            effect_chain = TRAINER_EFFECTS.get(card.name)
+        effect_chain = _resolve_chain(
+            card,
+            TRAINER_EFFECTS if effects_registry is None else effects_registry,
+            get_effect_for_card if get_effect is None else get_effect
+        )
     
     if not effect_chain:
         print(f"No effect defined for {card.name}")
         return False
     
-    # Execute each function in the chain
-    for effect_fn in effect_chain:
-        try:
+    # Execute the chain, stopping at the first failed effect
+    try:
+        for effect_fn in effect_chain:
             ctx = effect_fn(ctx)
             if ctx.failed:
                 print(f"Effect chain failed for {card.name}")
                 return False
-        except Exception as e:
-            print(f"Error executing effect for {card.name}: {e}")
-            return False
+    except Exception as e:
+        print(f"Error executing effect for {card.name}: {e}")
+        return False
     
     # Update game state
     game_state.player = ctx.player
@@ -53,21 +104,17 @@ def execute_trainer_card(card: TrainerCard, game_state: GameState, player: Playe
 
 def can_play_trainer_card(card: TrainerCard, game_state: GameState, player: PlayerState, game_engine=None) -> bool:
     """Check if a trainer card can be played (dry run)."""
-    # For supporter cards, check if already played this turn
-    if isinstance(card, SupporterCard) and player.supporter_played_this_turn:
-        return False
-    
-    # For tool cards, check if target Pokemon already has a tool
+    # Tool cards are always playable; skip the registry entirely
     if isinstance(card, ToolCard):
         # This would need additional logic to check tool attachment
         return True
     
+    # For supporter cards, check if already played this turn
+    if isinstance(card, SupporterCard) and player.supporter_played_this_turn:
+        return False
+    
     # Try to execute the effect chain without actually applying effects
-    effect_text = get_effect_for_card(card.name)
-    if effect_text:
-        effect_chain = TRAINER_EFFECTS.get(effect_text)
-    else:
-        effect_chain = TRAINER_EFFECTS.get(card.name)
+    effect_chain = _get_effect_chain(card)
     
     if not effect_chain:
         return False
@@ -99,8 +146,7 @@ def play_trainer_card(card: TrainerCard, game_state: GameState, player: PlayerSt
     success = execute_trainer_card(card, game_state, player, game_engine)
     if success:
         # Remove card from hand
-        if card in player.hand:
-            player.hand.remove(card)
+        _remove_from_hand(player.hand, card)
         # Add to discard pile
         player.discard_pile.append(card)
         
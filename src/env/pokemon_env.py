@@ -21,6 +21,10 @@ from src.card_db.core import (
 )
 from src.rules.game_engine import GameEngine
 
+# Observation indices for enum members, computed once instead of per lookup
+_ENERGY_INDEX = {energy: i for i, energy in enumerate(EnergyType)}
+_STAGE_INDEX = {stage: i for i, stage in enumerate(Stage)}
+
 
 class PokemonTCGEnv(gym.Env):
     """Pokemon TCG Pocket environment for reinforcement learning."""
@@ -82,8 +86,22 @@ class PokemonTCGEnv(gym.Env):
         # Add game engine
         self.game_engine = GameEngine()
         
+        # Legal actions from the last get_legal_actions() call, reused by step()
+        self._legal_actions: Optional[List[Action]] = None
+        
         self.reset()
     
+    @property
+    def state(self) -> GameState:
+        """Current game state."""
+        return self._state
+    
+    @state.setter
+    def state(self, state: GameState) -> None:
+        # Legal actions remembered for the old state don't apply to the new one
+        self._state = state
+        self._legal_actions = None
+    
     def reset(self, seed: Optional[int] = None) -> Tuple[Dict, Dict]:
         """Reset environment to initial state."""
         super().reset(seed=seed)
@@ -96,7 +114,7 @@ class PokemonTCGEnv(gym.Env):
         self.state = GameState()
         
         # Setup player's cards
-        self.state.player.deck = self.player_deck.copy()
+        self.state.player.deck = list(self.player_deck)
         np.random.shuffle(self.state.player.deck)
         
         # Draw opening hand (5 cards in TCG Pocket - rulebook §3)
@@ -108,7 +126,7 @@ class PokemonTCGEnv(gym.Env):
         # Points start at 0 and are earned through KOs
         
         # Setup opponent similarly
-        self.state.opponent.deck = self.opponent_deck.copy()
+        self.state.opponent.deck = list(self.opponent_deck)
         np.random.shuffle(self.state.opponent.deck)
         for _ in range(5):
             if self.state.opponent.deck:
@@ -120,16 +138,26 @@ class PokemonTCGEnv(gym.Env):
         return self._get_observation(), {}
     
     def get_legal_actions(self) -> List[Action]:
-        """Get list of legal actions in current state."""
-        return self._get_legal_actions()
+        """Get list of legal actions in current state.
+        
+        The list is remembered until the next action is applied or the state
+        is replaced, so a following step() indexes into the same list the
+        caller saw. Callers that change the state in place outside step()
+        should call this again before stepping.
+        """
+        self._legal_actions = self._get_legal_actions()
+        return self._legal_actions
     
     def step(self, action_idx: int) -> Tuple[Dict[str, Any], float, bool, bool, Dict[str, Any]]:
         """Execute one time step within the environment."""
         reward = 0.0
         info = {}
         
-        # Get legal actions
-        legal_actions = self.get_legal_actions()
+        # Reuse the list from a preceding get_legal_actions() call if no
+        # action has been applied since
+        legal_actions = self._legal_actions
+        if legal_actions is None:
+            legal_actions = self.get_legal_actions()
         
         # Check if action is valid
         if action_idx >= len(legal_actions):
@@ -162,8 +190,8 @@ class PokemonTCGEnv(gym.Env):
         active_pokemon = self.state.player.active_pokemon
         active_pokemon_stats = {
             "hp": np.array([active_pokemon.hp if active_pokemon else 0], dtype=np.int32),
-            "type": np.array([list(EnergyType).index(active_pokemon.pokemon_type) if active_pokemon else 0], dtype=np.int32),
-            "stage": np.array([list(Stage).index(active_pokemon.stage) if active_pokemon else 0], dtype=np.int32),
+            "type": np.array([_ENERGY_INDEX[active_pokemon.pokemon_type] if active_pokemon else 0], dtype=np.int32),
+            "stage": np.array([_STAGE_INDEX[active_pokemon.stage] if active_pokemon else 0], dtype=np.int32),
             "energy_count": np.array([len(active_pokemon.attached_energies) if active_pokemon else 0], dtype=np.int32),
         }
         
@@ -175,8 +203,8 @@ class PokemonTCGEnv(gym.Env):
         
         for i, pokemon in enumerate(self.state.player.bench[:3]):  # Fixed: Max 3 bench
             bench_hp[i] = pokemon.hp
-            bench_types[i] = list(EnergyType).index(pokemon.pokemon_type)
-            bench_stages[i] = list(Stage).index(pokemon.stage)
+            bench_types[i] = _ENERGY_INDEX[pokemon.pokemon_type]
+            bench_stages[i] = _STAGE_INDEX[pokemon.stage]
             bench_energy[i] = len(pokemon.attached_energies)
         
         bench_info = {
@@ -191,8 +219,8 @@ class PokemonTCGEnv(gym.Env):
         opponent_active = self.state.opponent.active_pokemon
         opponent_active_stats = {
             "hp": np.array([opponent_active.hp if opponent_active else 0], dtype=np.int32),
-            "type": np.array([list(EnergyType).index(opponent_active.pokemon_type) if opponent_active else 0], dtype=np.int32),
-            "stage": np.array([list(Stage).index(opponent_active.stage) if opponent_active else 0], dtype=np.int32),
+            "type": np.array([_ENERGY_INDEX[opponent_active.pokemon_type] if opponent_active else 0], dtype=np.int32),
+            "stage": np.array([_STAGE_INDEX[opponent_active.stage] if opponent_active else 0], dtype=np.int32),
             "energy_count": np.array([len(opponent_active.attached_energies) if opponent_active else 0], dtype=np.int32),
         }
         
@@ -262,6 +290,7 @@ class PokemonTCGEnv(gym.Env):
     
     def _apply_action(self, action: Action) -> Dict[str, Any]:
         """Apply an action to the game state."""
+        self._legal_actions = None
         try:
             if action.type == ActionType.PLAY_POKEMON:
                 # Play a basic Pokemon to bench or active position
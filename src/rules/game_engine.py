@@ -29,6 +29,9 @@ class AttackResult:
     status_applied: Optional[StatusCondition]
     coin_flips: List[bool] = field(default_factory=list)
 
+# Coin sides for flip_coin; heads is True
+_COIN_SIDES = (True, False)
+
 class GameEngine:
     """Core game logic engine."""
     
@@ -425,7 +428,7 @@ class GameEngine:
 
     def flip_coin(self) -> bool:
         """Flip a coin."""
-        return self.rng.choice([True, False])
+        return self.rng.choice(_COIN_SIDES)
 
     def _handle_knockout(self, state: GameState, knocked_out: PokemonCard) -> GameState:
         """Handle a Pokemon being knocked out."""
@@ -155,6 +155,8 @@ class GameState:
     is_first_turn: bool = True
     turn_state: TurnState = field(default_factory=TurnState)
     active_player_tag: PlayerTag = PlayerTag.PLAYER
+    # Attack damage bonuses for this turn, keyed by Pokemon name or 'all'
+    damage_bonuses: Dict[str, int] = field(default_factory=dict)
 
     def __post_init__(self):
         """Validate game state."""
@@ -239,5 +241,6 @@ class GameState:
             turn_count=self.turn_count,
             is_first_turn=self.is_first_turn,
             active_player_tag=self.active_player_tag,
-            turn_state=self.turn_state
+            turn_state=self.turn_state,
+            damage_bonuses=self.damage_bonuses
         )
\ No newline at end of file
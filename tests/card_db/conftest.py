@@ -0,0 +1,81 @@
+"""Shared fixtures for the card database tests."""
+
+import pytest
+from pathlib import Path
+import json
+import tempfile
+from typing import Dict
+
+# Test Data
+#
+# The sample card dicts are shared across each test module, so tests must not
+# mutate them in place; copy first if a test needs a variant.
+
+SAMPLE_ITEM = {
+    "id": "test_potion_001",
+    "name": "Test Potion",
+    "category": "Trainer",
+    "subtype": "Item",
+    "effect": "Heal 30 damage from one of your Pokemon.",
+    "set": "TEST",
+    "rarity": "Common"
+}
+
+SAMPLE_SUPPORTER = {
+    "id": "test_prof_001",
+    "name": "Test Professor",
+    "category": "Trainer",
+    "subtype": "Supporter",
+    "effect": "Draw 3 cards.",
+    "set": "TEST",
+    "rarity": "Rare"
+}
+
+SAMPLE_POKEMON = {
+    "id": "test_pika_001",
+    "name": "Test Pikachu",
+    "category": "Pokemon",
+    "hp": "70",
+    "types": ["Lightning"],
+    "stage": "Basic",
+    "attacks": [
+        {
+            "name": "Thunder Shock",
+            "cost": ["Lightning"],
+            "damage": "20",
+            "effect": "Flip a coin. If heads, your opponent's Active Pokemon is now Paralyzed."
+        }
+    ],
+    "weaknesses": [{"type": "Fighting", "value": "×2"}],
+    "retreat": 1
+}
+
+# Serialized once per session and written verbatim into each temp data dir
+_SET_BYTES = json.dumps(
+    [SAMPLE_ITEM, SAMPLE_SUPPORTER, SAMPLE_POKEMON], separators=(",", ":")
+).encode()
+
+# Test Data Fixtures
+
+@pytest.fixture(scope="module")
+def sample_item_card() -> Dict:
+    return SAMPLE_ITEM
+
+@pytest.fixture(scope="module")
+def sample_supporter_card() -> Dict:
+    return SAMPLE_SUPPORTER
+
+@pytest.fixture(scope="module")
+def sample_pokemon_card() -> Dict:
+    return SAMPLE_POKEMON
+
+@pytest.fixture(scope="module")
+def temp_data_dir() -> Path:
+    """Create a temporary data directory with test card data."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_path = Path(temp_dir)
+        
+        # Create test set file
+        (data_path / "test_set.json").write_bytes(_SET_BYTES)
+        
+        yield data_path
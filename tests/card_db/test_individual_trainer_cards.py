@@ -1,13 +1,15 @@
-#!/usr/bin/env python3
 """
 Comprehensive test file for individual trainer card effects.
 
 This file tests each trainer card in the registry to verify they work correctly
-with the composable effects system.
+with the composable effects system. Run it with
+``pytest tests/card_db/test_individual_trainer_cards.py``.
 """
 
+import copy
+import dataclasses
+
 import pytest
-from unittest.mock import Mock, patch
 from src.card_db.core import (
     PokemonCard, ItemCard, ToolCard, SupporterCard, 
     EnergyType, Stage, StatusCondition
@@ -19,208 +21,235 @@ from src.rules.game_engine import GameEngine
 from src.card_db.comprehensive_trainer_registry import TRAINER_EFFECTS, CARD_NAME_TO_EFFECT
 
 
-class TestTrainerCardEffects:
-    """Test suite for individual trainer card effects."""
+@pytest.fixture(scope="module")
+def prototype_state():
+    """Build the shared game state once per module."""
+    game_state = GameState()
+    game_state.phase = GamePhase.MAIN
+    game_state.active_player = PlayerTag.PLAYER
     
-    def setup_method(self):
-        """Set up test fixtures for each test."""
-        self.game_state = GameState()
-        self.game_state.phase = GamePhase.MAIN
-        self.game_state.active_player = PlayerTag.PLAYER
-        self.game_engine = GameEngine()
-        
-        # Create test Pokemon
-        self.grass_pokemon = PokemonCard(
-            id='test-grass-001',
-            name='Bulbasaur',
-            hp=70,
-            pokemon_type=EnergyType.GRASS,
-            stage=Stage.BASIC,
-            damage_counters=30  # Damaged
-        )
-        
-        self.water_pokemon = PokemonCard(
-            id='test-water-001',
-            name='Squirtle',
-            hp=60,
-            pokemon_type=EnergyType.WATER,
-            stage=Stage.BASIC
-        )
-        
-        self.fire_pokemon = PokemonCard(
-            id='test-fire-001',
-            name='Charmander',
-            hp=60,
-            pokemon_type=EnergyType.FIRE,
-            stage=Stage.BASIC
-        )
-        
-        self.opponent_pokemon = PokemonCard(
-            id='test-opponent-001',
-            name='Pikachu',
-            hp=60,
-            pokemon_type=EnergyType.ELECTRIC,
-            stage=Stage.BASIC,
-            damage_counters=20  # Damaged
-        )
-        
-        self.opponent_bench_pokemon = PokemonCard(
-            id='test-opponent-bench-001',
-            name='Raichu',
-            hp=90,
-            pokemon_type=EnergyType.ELECTRIC,
-            stage=Stage.STAGE_1,
-            damage_counters=40  # Damaged
-        )
-        
-        # Set up basic game state
-        self.game_state.player.active_pokemon = self.grass_pokemon
-        self.game_state.player.bench = [self.water_pokemon, self.fire_pokemon]
-        self.game_state.opponent.active_pokemon = self.opponent_pokemon
-        self.game_state.opponent.bench = [self.opponent_bench_pokemon]
-        
-        # Add energy to player's zone
-        self.game_state.player.energy_zone = EnergyType.GRASS
+    # Create test Pokemon
+    grass_pokemon = PokemonCard(
+        id='test-grass-001',
+        name='Bulbasaur',
+        hp=70,
+        pokemon_type=EnergyType.GRASS,
+        stage=Stage.BASIC,
+        damage_counters=30  # Damaged
+    )
     
-    def create_trainer_card(self, name: str, card_type: type = SupporterCard) -> object:
-        """Create a trainer card for testing."""
-        return card_type(
-            id=f'trainer-{name.lower().replace(" ", "-")}',
-            name=name,
-            effects=[]  # Effects are handled by the registry
-        )
+    water_pokemon = PokemonCard(
+        id='test-water-001',
+        name='Squirtle',
+        hp=60,
+        pokemon_type=EnergyType.WATER,
+        stage=Stage.BASIC
+    )
     
-    def test_erika_healing(self):
-        """Test Erika's healing effect on Grass Pokemon."""
-        print("\n🧪 Testing Erika - Heal Grass Pokemon")
-        print("=" * 50)
-        
-        # Create Erika card
-        erika = self.create_trainer_card("Erika")
-        self.game_state.player.hand.append(erika)
-        
-        # Record initial damage
-        initial_damage = self.grass_pokemon.damage_counters
-        print(f"Initial damage on {self.grass_pokemon.name}: {initial_damage}")
-        
-        # Execute Erika
-        success = execute_trainer_card(erika, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Verify results
-        assert success, "Erika should execute successfully"
-        expected_damage = max(0, initial_damage - 50)
-        print(f"Expected damage after healing: {expected_damage}")
-        print(f"Actual damage after healing: {self.grass_pokemon.damage_counters}")
-        assert self.grass_pokemon.damage_counters == expected_damage
-        print("✅ Erika healing test passed!")
+    fire_pokemon = PokemonCard(
+        id='test-fire-001',
+        name='Charmander',
+        hp=60,
+        pokemon_type=EnergyType.FIRE,
+        stage=Stage.BASIC
+    )
     
-    def test_erika_no_grass_pokemon(self):
-        """Test Erika fails when no Grass Pokemon are available."""
-        print("\n🧪 Testing Erika - No Grass Pokemon")
-        print("=" * 50)
-        
-        # Remove grass Pokemon from play
-        self.game_state.player.active_pokemon = self.water_pokemon
-        self.game_state.player.bench = [self.fire_pokemon]
-        
-        erika = self.create_trainer_card("Erika")
-        self.game_state.player.hand.append(erika)
-        
-        # Execute Erika
-        success = execute_trainer_card(erika, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Should fail - no grass Pokemon
-        assert not success, "Erika should fail when no Grass Pokemon are available"
-        print("✅ Erika no-target test passed!")
+    opponent_pokemon = PokemonCard(
+        id='test-opponent-001',
+        name='Pikachu',
+        hp=60,
+        pokemon_type=EnergyType.ELECTRIC,
+        stage=Stage.BASIC,
+        damage_counters=20  # Damaged
+    )
     
-    def test_sabrina_switching(self):
-        """Test Sabrina's opponent Pokemon switching."""
-        print("\n🧪 Testing Sabrina - Switch Opponent Pokemon")
-        print("=" * 50)
-        
-        sabrina = self.create_trainer_card("Sabrina")
-        self.game_state.player.hand.append(sabrina)
-        
-        # Record initial active Pokemon
-        initial_active = self.game_state.opponent.active_pokemon
-        print(f"Initial opponent active: {initial_active.name}")
-        print(f"Opponent bench: {[p.name for p in self.game_state.opponent.bench]}")
-        
-        # Execute Sabrina
-        success = execute_trainer_card(sabrina, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Verify switching occurred
-        assert success, "Sabrina should execute successfully"
-        assert self.game_state.opponent.active_pokemon != initial_active, "Active Pokemon should have changed"
-        print(f"New opponent active: {self.game_state.opponent.active_pokemon.name}")
-        print("✅ Sabrina switching test passed!")
+    opponent_bench_pokemon = PokemonCard(
+        id='test-opponent-bench-001',
+        name='Raichu',
+        hp=90,
+        pokemon_type=EnergyType.ELECTRIC,
+        stage=Stage.STAGE_1,
+        damage_counters=40  # Damaged
+    )
     
-    def test_sabrina_no_bench(self):
-        """Test Sabrina fails when opponent has no bench."""
-        print("\n🧪 Testing Sabrina - No Opponent Bench")
-        print("=" * 50)
-        
-        # Remove opponent's bench
-        self.game_state.opponent.bench = []
-        
-        sabrina = self.create_trainer_card("Sabrina")
-        self.game_state.player.hand.append(sabrina)
-        
-        # Execute Sabrina
-        success = execute_trainer_card(sabrina, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Should fail - no bench Pokemon
-        assert not success, "Sabrina should fail when opponent has no bench"
-        print("✅ Sabrina no-bench test passed!")
+    # Set up basic game state
+    game_state.player.active_pokemon = grass_pokemon
+    game_state.player.bench = [water_pokemon, fire_pokemon]
+    game_state.opponent.active_pokemon = opponent_pokemon
+    game_state.opponent.bench = [opponent_bench_pokemon]
     
-    def test_cyrus_damaged_switch(self):
-        """Test Cyrus switches in damaged opponent Pokemon."""
-        print("\n🧪 Testing Cyrus - Switch Damaged Opponent")
-        print("=" * 50)
-        
-        cyrus = self.create_trainer_card("Cyrus")
-        self.game_state.player.hand.append(cyrus)
-        
-        # Ensure bench Pokemon is damaged
-        self.opponent_bench_pokemon.damage_counters = 30
-        
-        print(f"Opponent bench Pokemon damage: {self.opponent_bench_pokemon.damage_counters}")
-        
-        # Execute Cyrus
-        success = execute_trainer_card(cyrus, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Verify damaged Pokemon was switched in
-        assert success, "Cyrus should execute successfully"
-        assert self.game_state.opponent.active_pokemon == self.opponent_bench_pokemon, "Damaged Pokemon should be active"
-        print("✅ Cyrus damaged switch test passed!")
+    # Add energy to player's zone
+    game_state.player.energy_zone = EnergyType.GRASS
+    return game_state
+
+
+def _fresh_pokemon(proto):
+    """Copy a Pokemon, giving it its own attached energy list."""
+    return dataclasses.replace(proto, attached_energies=list(proto.attached_energies))
+
+
+def _fresh_player(proto):
+    """Copy a player, cloning the Pokemon and card lists tests mutate."""
+    return dataclasses.replace(
+        proto,
+        active_pokemon=_fresh_pokemon(proto.active_pokemon),
+        bench=[_fresh_pokemon(p) for p in proto.bench],
+        hand=list(proto.hand),
+        deck=list(proto.deck),
+        discard_pile=list(proto.discard_pile)
+    )
+
+
+def _fresh(proto):
+    """Clone only the parts of the prototype state that tests mutate."""
+    return dataclasses.replace(
+        proto,
+        player=_fresh_player(proto.player),
+        opponent=_fresh_player(proto.opponent),
+        damage_bonuses=dict(proto.damage_bonuses)
+    )
+
+
+@pytest.fixture
+def game(prototype_state):
+    """Fresh copy of the prototype state for tests that mutate it."""
+    return _fresh(prototype_state)
+
+
+@pytest.fixture(scope="module")
+def game_engine():
+    """Game engine shared by the module; coin flips are patched per test."""
+    return GameEngine()
+
+
+# Coin flips for Misty: 2 heads, then tails (GameEngine.flip_coin returns True for heads)
+MISTY_FLIPS = (True, True, False)
+
+# Supporters under test; their effects are handled by the registry
+TRAINER_NAMES = ("Erika", "Sabrina", "Cyrus", "Misty", "Giovanni", "Blaine")
+
+
+@pytest.fixture(scope="module")
+def trainer_prototypes():
+    """Build one supporter prototype per name, once per module."""
+    return {
+        name: SupporterCard(
+            id=f'trainer-{name.lower().replace(" ", "-")}',
+            name=name,
+            effects=[],
+            text=CARD_NAME_TO_EFFECT.get(name, "")
+        )
+        for name in TRAINER_NAMES
+    }
+
+
+@pytest.fixture
+def create_trainer_card(trainer_prototypes):
+    """Create a supporter card for testing from its module-scoped prototype."""
+    def create(name: str) -> SupporterCard:
+        return copy.copy(trainer_prototypes[name])
+    return create
+
+
+def setup_default(game):
+    """Leave the prototype board untouched."""
+
+
+def remove_grass(game):
+    """Replace the Grass active with the Water and Fire Pokemon."""
+    water_pokemon, fire_pokemon = game.player.bench
+    game.player.active_pokemon = water_pokemon
+    game.player.bench = [fire_pokemon]
+
+
+def clear_opp_bench(game):
+    """Remove every Pokemon from the opponent's bench."""
+    game.opponent.bench = []
+
+
+def damage_opp_bench(game):
+    """Make sure the opponent's benched Pokemon has damage on it."""
+    game.opponent.bench[0].damage_counters = 30
+
+
+def heal_opp_bench(game):
+    """Remove all damage from the opponent's benched Pokemon."""
+    game.opponent.bench[0].damage_counters = 0
+
+
+def ninetales_active(game):
+    """Put a Ninetales, which benefits from Blaine, in the Active Spot."""
+    game.player.active_pokemon = PokemonCard(
+        id='test-ninetales',
+        name='Ninetales',
+        hp=90,
+        pokemon_type=EnergyType.FIRE,
+        stage=Stage.STAGE_1
+    )
+
+
+def grass_healed(game):
+    """Erika heals 50 damage from the damaged Bulbasaur."""
+    assert game.player.active_pokemon.damage_counters == 0
+
+
+def opponent_switched(game):
+    """Sabrina replaces the opponent's Active Pokemon."""
+    assert game.opponent.active_pokemon.id != 'test-opponent-001', "Active Pokemon should have changed"
+
+
+def damaged_switched_in(game):
+    """Cyrus brings the damaged benched Pokemon into the Active Spot."""
+    assert game.opponent.active_pokemon.id == 'test-opponent-bench-001', "Damaged Pokemon should be active"
+
+
+# (card name, board mutation, expected success, post-condition check)
+TRAINER_CASES = [
+    ("Erika", setup_default, True, grass_healed),
+    ("Erika", remove_grass, False, None),
+    ("Sabrina", setup_default, True, opponent_switched),
+    ("Sabrina", clear_opp_bench, False, None),
+    ("Cyrus", damage_opp_bench, True, damaged_switched_in),
+    ("Cyrus", heal_opp_bench, False, None),
+    ("Giovanni", setup_default, True, None),
+    ("Blaine", ninetales_active, True, None),
+]
+
+
+@pytest.mark.parametrize(
+    "name,mutate,expected,check",
+    TRAINER_CASES,
+    ids=[f"trainer-{name}-{mutate.__name__}" for name, mutate, _, _ in TRAINER_CASES],
+)
+def test_trainer(game, game_engine, create_trainer_card, name, mutate, expected, check):
+    """Each supporter succeeds or fails depending on the board it is played on."""
+    mutate(game)
+    card = create_trainer_card(name)
+    game.player.hand.append(card)
     
-    def test_cyrus_no_damaged_bench(self):
-        """Test Cyrus fails when no damaged bench Pokemon."""
-        print("\n🧪 Testing Cyrus - No Damaged Bench")
-        print("=" * 50)
-        
-        # Remove damage from bench Pokemon
-        self.opponent_bench_pokemon.damage_counters = 0
-        
-        cyrus = self.create_trainer_card("Cyrus")
-        self.game_state.player.hand.append(cyrus)
-        
-        # Execute Cyrus
-        success = execute_trainer_card(cyrus, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Should fail - no damaged bench Pokemon
-        assert not success, "Cyrus should fail when no damaged bench Pokemon"
-        print("✅ Cyrus no-damaged-bench test passed!")
+    assert execute_trainer_card(card, game, game.player, game_engine) is expected
+    if check is not None:
+        check(game)
+
+
+class TestTrainerCardEffects:
+    """Test suite for individual trainer card effects."""
+    @pytest.fixture(autouse=True)
+    def bind_state(self, game, game_engine, create_trainer_card):
+        """Expose the per-test game state and its Pokemon as attributes."""
+        self.game_state = game
+        self.game_engine = game_engine
+        self.create_trainer_card = create_trainer_card
+        self.grass_pokemon = game.player.active_pokemon
+        self.water_pokemon, self.fire_pokemon = game.player.bench
+        self.opponent_pokemon = game.opponent.active_pokemon
+        self.opponent_bench_pokemon = game.opponent.bench[0]
     
-    @patch('src.rules.game_engine.GameEngine.flip_coin')
-    def test_misty_energy_attachment(self, mock_flip):
+    def test_misty_energy_attachment(self, monkeypatch):
         """Test Misty's coin flip energy attachment."""
-        print("\n🧪 Testing Misty - Energy Attachment")
-        print("=" * 50)
-        
         # Mock coin flips: 2 heads, then tails
-        from src.rules.game_engine import CoinFlipResult
-        mock_flip.side_effect = [CoinFlipResult.HEADS, CoinFlipResult.HEADS, CoinFlipResult.TAILS]
+        flips = iter(MISTY_FLIPS)
+        monkeypatch.setattr(GameEngine, "flip_coin", lambda self, *a, **k: next(flips))
         
         # Set up water energy in zone
         self.game_state.player.energy_zone = EnergyType.WATER
@@ -230,7 +259,6 @@ class TestTrainerCardEffects:
         
         # Record initial energy count
         initial_energy = len(self.water_pokemon.attached_energies)
-        print(f"Initial energy on {self.water_pokemon.name}: {initial_energy}")
         
         # Execute Misty
         success = execute_trainer_card(misty, self.game_state, self.game_state.player, self.game_engine)
@@ -242,55 +270,9 @@ class TestTrainerCardEffects:
         final_energy = len(self.water_pokemon.attached_energies)
         expected_energy = initial_energy + 2  # 2 heads = 2 energy
         assert final_energy == expected_energy, f"Expected {expected_energy} energy, got {final_energy}"
-        print(f"Final energy on {self.water_pokemon.name}: {final_energy}")
-        print("✅ Misty energy attachment test passed!")
-    
-    def test_giovanni_damage_bonus(self):
-        """Test Giovanni's damage bonus effect."""
-        print("\n🧪 Testing Giovanni - Damage Bonus")
-        print("=" * 50)
-        
-        giovanni = self.create_trainer_card("Giovanni")
-        self.game_state.player.hand.append(giovanni)
-        
-        # Execute Giovanni
-        success = execute_trainer_card(giovanni, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Verify damage bonus is applied
-        assert success, "Giovanni should execute successfully"
-        # Note: In a real implementation, you'd check if damage bonus is tracked
-        print("✅ Giovanni damage bonus test passed!")
-    
-    def test_blaine_specific_pokemon_bonus(self):
-        """Test Blaine's damage bonus for specific Pokemon."""
-        print("\n🧪 Testing Blaine - Specific Pokemon Damage Bonus")
-        print("=" * 50)
-        
-        # Create a Pokemon that benefits from Blaine
-        ninetales = PokemonCard(
-            id='test-ninetales',
-            name='Ninetales',
-            hp=90,
-            pokemon_type=EnergyType.FIRE,
-            stage=Stage.STAGE_1
-        )
-        self.game_state.player.active_pokemon = ninetales
-        
-        blaine = self.create_trainer_card("Blaine")
-        self.game_state.player.hand.append(blaine)
-        
-        # Execute Blaine
-        success = execute_trainer_card(blaine, self.game_state, self.game_state.player, self.game_engine)
-        
-        # Verify damage bonus is applied
-        assert success, "Blaine should execute successfully"
-        print("✅ Blaine specific Pokemon bonus test passed!")
     
     def test_supporter_once_per_turn_restriction(self):
         """Test that supporter cards can only be played once per turn."""
-        print("\n🧪 Testing Supporter Once Per Turn Restriction")
-        print("=" * 50)
-        
         giovanni1 = self.create_trainer_card("Giovanni")
         giovanni2 = self.create_trainer_card("Giovanni")
         self.game_state.player.hand.extend([giovanni1, giovanni2])
@@ -305,13 +287,9 @@ class TestTrainerCardEffects:
         # Second Giovanni should fail
         can_play = can_play_trainer_card(giovanni2, self.game_state, self.game_state.player, self.game_engine)
         assert not can_play, "Second supporter should not be playable"
-        print("✅ Supporter restriction test passed!")
     
     def test_tool_card_attachment(self):
         """Test tool card attachment to Pokemon."""
-        print("\n🧪 Testing Tool Card Attachment")
-        print("=" * 50)
-        
         # Create a tool card
         giant_cape = ToolCard(
             id='tool-giant-cape',
@@ -325,13 +303,9 @@ class TestTrainerCardEffects:
         
         # Note: Tool attachment logic would need to be implemented
         # For now, just verify it doesn't crash
-        print("✅ Tool card attachment test passed!")
     
     def test_item_card_multiple_uses(self):
         """Test that item cards can be played multiple times per turn."""
-        print("\n🧪 Testing Item Card Multiple Uses")
-        print("=" * 50)
-        
         # Create item cards with a defined effect
         potion1 = ItemCard(id='item-potion-1', name='Potion', effects=[])
         potion2 = ItemCard(id='item-potion-2', name='Potion', effects=[])
@@ -351,105 +325,37 @@ class TestTrainerCardEffects:
         # Execute second potion
         success2 = execute_trainer_card(potion2, self.game_state, self.game_state.player, self.game_engine)
         assert success2, "Second potion should execute successfully"
-        
-        print("✅ Item card multiple uses test passed!")
-    
-    def test_all_registered_cards_have_effects(self):
-        """Test that all cards in the registry have defined effects."""
-        print("\n🧪 Testing All Registered Cards Have Effects")
-        print("=" * 50)
-        
-        # Test that we have effects defined
-        assert len(TRAINER_EFFECTS) > 0
-        assert len(CARD_NAME_TO_EFFECT) > 0
-        
-        # Test that specific cards have effects
-        test_cards = ["Erika", "Sabrina", "Cyrus", "Misty", "Giovanni", "Blaine"]
-        for card_name in test_cards:
-            effect_text = CARD_NAME_TO_EFFECT.get(card_name)
-            assert effect_text is not None, f"Card {card_name} should have an effect defined"
-            assert effect_text in TRAINER_EFFECTS, f"Effect for {card_name} should be in TRAINER_EFFECTS"
-            print(f"✅ {card_name}: {effect_text}")
-        
-        print("✅ All registered cards have effects!")
-    
-    def test_effect_context_data_passing(self):
-        """Test that effect context properly passes data between functions."""
-        print("\n🧪 Testing Effect Context Data Passing")
-        print("=" * 50)
-        
-        # Create a context
-        ctx = EffectContext(self.game_state, self.game_state.player, self.game_engine)
-        
-        # Test data storage and retrieval
-        ctx.data['test_key'] = 'test_value'
-        assert ctx.data['test_key'] == 'test_value'
-        
-        # Test target storage
-        ctx.targets = [self.grass_pokemon]
-        assert len(ctx.targets) == 1
-        assert ctx.targets[0] == self.grass_pokemon
-        
-        # Test failure flag
-        ctx.failed = True
-        assert ctx.failed is True
-        
-        print("✅ Effect context data passing test passed!")
-    
-    def run_all_tests(self):
-        """Run all trainer card tests."""
-        print("\n🎯 Running All Trainer Card Tests")
-        print("=" * 60)
-        
-        test_methods = [
-            self.test_erika_healing,
-            self.test_erika_no_grass_pokemon,
-            self.test_sabrina_switching,
-            self.test_sabrina_no_bench,
-            self.test_cyrus_damaged_switch,
-            self.test_cyrus_no_damaged_bench,
-            self.test_misty_energy_attachment,
-            self.test_giovanni_damage_bonus,
-            self.test_blaine_specific_pokemon_bonus,
-            self.test_supporter_once_per_turn_restriction,
-            self.test_tool_card_attachment,
-            self.test_item_card_multiple_uses,
-            self.test_all_registered_cards_have_effects,
-            self.test_effect_context_data_passing,
-        ]
-        
-        passed = 0
-        failed = 0
-        
-        for test_method in test_methods:
-            try:
-                # Reset state for each test
-                self.setup_method()
-                test_method()
-                passed += 1
-            except Exception as e:
-                print(f"❌ {test_method.__name__} FAILED: {e}")
-                failed += 1
-        
-        print(f"\n📊 Test Results: {passed} passed, {failed} failed")
-        return failed == 0
 
 
-def test_individual_trainer_cards():
-    """Pytest entry point for individual trainer card tests."""
-    tester = TestTrainerCardEffects()
-    success = tester.run_all_tests()
-    assert success, "All trainer card tests should pass"
+def test_registry_has_effects():
+    """Test that the registry defines effects and maps card names to them."""
+    assert len(TRAINER_EFFECTS) > 0
+    assert len(CARD_NAME_TO_EFFECT) > 0
+
 
+@pytest.mark.parametrize("card_name", TRAINER_NAMES, ids=lambda n: f"trainer-{n}")
+def test_all_registered_cards_have_effects(card_name):
+    """Test that each card under test has an effect in the registry."""
+    effect_text = CARD_NAME_TO_EFFECT.get(card_name)
+    assert effect_text is not None, f"Card {card_name} should have an effect defined"
+    assert effect_text in TRAINER_EFFECTS, f"Effect for {card_name} should be in TRAINER_EFFECTS"
 
-if __name__ == "__main__":
-    """Run all tests when executed directly."""
-    tester = TestTrainerCardEffects()
-    success = tester.run_all_tests()
+
+def test_effect_context_data_passing(prototype_state, game_engine):
+    """Test that effect context properly passes data between functions."""
+    # Create a context
+    ctx = EffectContext(prototype_state, prototype_state.player, game_engine)
+    
+    # Test data storage and retrieval
+    ctx.data['test_key'] = 'test_value'
+    assert ctx.data['test_key'] == 'test_value'
+    
+    # Test target storage
+    grass_pokemon = prototype_state.player.active_pokemon
+    ctx.targets = [grass_pokemon]
+    assert len(ctx.targets) == 1
+    assert ctx.targets[0] == grass_pokemon
     
-    if success:
-        print("\n🎉 All trainer card tests passed!")
-        exit(0)
-    else:
-        print("\n💥 Some trainer card tests failed!")
-        exit(1)
\ No newline at end of file
+    # Test failure flag
+    ctx.failed = True
+    assert ctx.failed is True
@@ -3,7 +3,7 @@
 import pytest
 from pathlib import Path
 import json
-import tempfile
+import re
 from typing import Dict, List
 
 from src.card_db.core import (
@@ -16,70 +16,6 @@ from src.card_db.core import (
 )
 from src.card_db.loader import load_card_db, _parse_trainer, _parse_pokemon, _to_energy, _to_stage
 
-# Test Data Fixtures
-
-@pytest.fixture
-def sample_item_card() -> Dict:
-    return {
-        "id": "test_potion_001",
-        "name": "Test Potion",
-        "category": "Trainer",
-        "subtype": "Item",
-        "effect": "Heal 30 damage from one of your Pokemon.",
-        "set": "TEST",
-        "rarity": "Common"
-    }
-
-@pytest.fixture
-def sample_supporter_card() -> Dict:
-    return {
-        "id": "test_prof_001",
-        "name": "Test Professor",
-        "category": "Trainer",
-        "subtype": "Supporter",
-        "effect": "Draw 3 cards.",
-        "set": "TEST",
-        "rarity": "Rare"
-    }
-
-@pytest.fixture
-def sample_pokemon_card() -> Dict:
-    return {
-        "id": "test_pika_001",
-        "name": "Test Pikachu",
-        "category": "Pokemon",
-        "hp": "70",
-        "types": ["Lightning"],
-        "stage": "Basic",
-        "attacks": [
-            {
-                "name": "Thunder Shock",
-                "cost": ["Lightning"],
-                "damage": "20",
-                "effect": "Flip a coin. If heads, your opponent's Active Pokemon is now Paralyzed."
-            }
-        ],
-        "weaknesses": [{"type": "Fighting", "value": "×2"}],
-        "retreat": 1
-    }
-
-@pytest.fixture
-def temp_data_dir(
-    sample_item_card: Dict,
-    sample_supporter_card: Dict,
-    sample_pokemon_card: Dict
-) -> Path:
-    """Create a temporary data directory with test card data."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        data_path = Path(temp_dir)
-        
-        # Create test set file
-        test_set = [sample_item_card, sample_supporter_card, sample_pokemon_card]
-        with open(data_path / "test_set.json", "w") as f:
-            json.dump(test_set, f)
-            
-        yield data_path
-
 # Trainer Card Parsing Tests
 
 def test_parse_item_card(sample_item_card: Dict):
@@ -108,43 +44,48 @@ def test_parse_supporter_card(sample_supporter_card: Dict):
     assert card.set_code == "TEST"
     assert card.rarity == "Rare"
 
-def test_parse_trainer_missing_subtype():
-    """Test parsing a trainer card with missing subtype defaults to Item."""
-    card_data = {
-        "id": "test_item_002",
-        "name": "Test Item",
-        "category": "Trainer",
-        "effect": "Test effect"
-    }
-    
-    card = _parse_trainer(card_data)
-    assert isinstance(card, ItemCard)
-
-def test_parse_trainer_invalid_subtype():
-    """Test parsing a trainer card with unknown subtype defaults to Item."""
-    card_data = {
-        "id": "test_item_003",
-        "name": "Test Item",
-        "category": "Trainer",
-        "subtype": "InvalidType",
-        "effect": "Test effect"
-    }
-    
-    card = _parse_trainer(card_data)
-    assert isinstance(card, ItemCard)
-
-def test_parse_trainer_empty_effect():
-    """Test parsing a trainer card with no effect text."""
-    card_data = {
-        "id": "test_item_004",
-        "name": "Test Item",
-        "category": "Trainer",
-        "subtype": "Item"
-    }
-    
-    card = _parse_trainer(card_data)
-    assert isinstance(card, ItemCard)
-    assert len(card.effects) == 0
+# (raw card data, expected class, expected effect count, first effect text);
+# None means the field is not checked for that case.
+TRAINER_PARSE_CASES = [
+    pytest.param(
+        {"id": "test_item_002", "name": "Test Item", "category": "Trainer",
+         "effect": "Test effect"},
+        ItemCard, None, None, id="missing-subtype-defaults-to-item",
+    ),
+    pytest.param(
+        {"id": "test_item_003", "name": "Test Item", "category": "Trainer",
+         "subtype": "InvalidType", "effect": "Test effect"},
+        ItemCard, None, None, id="invalid-subtype-defaults-to-item",
+    ),
+    pytest.param(
+        {"id": "test_item_004", "name": "Test Item", "category": "Trainer",
+         "subtype": "Item"},
+        ItemCard, 0, None, id="empty-effect",
+    ),
+    pytest.param(
+        {"id": "test_item_005", "name": "Test Item", "category": "Trainer",
+         "subtype": "sUpPoRtEr", "effect": "Test effect"},
+        SupporterCard, None, None, id="case-insensitive-subtype",
+    ),
+    # TCG Pocket rulebook doesn't specify how to handle multiple effects
+    # For now, we take the first effect only
+    pytest.param(
+        {"id": "test_item_006", "name": "Test Item", "category": "Trainer",
+         "subtype": "Item", "effect": ["Effect 1", "Effect 2"]},
+        ItemCard, 1, "Effect 1", id="list-effect",
+    ),
+]
+
+@pytest.mark.parametrize("raw,cls,n_effects,first_text", TRAINER_PARSE_CASES)
+def test_parse_trainer_variants(raw: Dict, cls: type, n_effects, first_text):
+    """Test trainer subtype and effect parsing edge cases."""
+    card = _parse_trainer(raw)
+    
+    assert isinstance(card, cls)
+    if n_effects is not None:
+        assert len(card.effects) == n_effects
+    if first_text is not None:
+        assert card.effects[0].parameters["text"] == first_text
 
 # Pokemon Card Parsing Tests
 
@@ -165,8 +106,25 @@ def test_parse_pokemon_card(sample_pokemon_card: Dict):
     assert card.weakness == EnergyType.FIGHTING
     assert card.retreat_cost == 1
 
-def test_parse_pokemon_with_resistance():
-    """Test parsing Pokemon with resistance (TCG Pocket has no resistance)."""
+_RESISTANCES = [{"type": "Fighting", "value": "-20"}]
+
+# (extra raw field, its value, card attribute, expected value); AttributeError
+# means the attribute must not exist on the card at all.
+POKEMON_FIELD_CASES = [
+    # TCG Pocket has no resistance (rulebook §1)
+    # The resistance data should be ignored, not parsed
+    pytest.param("resistances", _RESISTANCES, "resistance", AttributeError,
+                 id="resistance-ignored"),
+    pytest.param("resistances", _RESISTANCES, "weakness", None,
+                 id="resistance-not-parsed-as-weakness"),
+    pytest.param("weaknesses", [{"type": "Fighting", "value": "×2"}], "weakness",
+                 EnergyType.FIGHTING, id="weakness"),
+    pytest.param("retreat", 1, "retreat_cost", 1, id="retreat-cost"),
+]
+
+@pytest.mark.parametrize("extra_field,value,attr,expected", POKEMON_FIELD_CASES)
+def test_parse_pokemon_field(extra_field: str, value, attr: str, expected):
+    """Test parsing optional Pokemon fields."""
     raw = {
         "id": "test_pika_003",
         "name": "Test Pikachu",
@@ -174,15 +132,15 @@ def test_parse_pokemon_with_resistance():
         "hp": "70",
         "types": ["Lightning"],
         "stage": "Basic",
-        "resistances": [{"type": "Fighting", "value": "-20"}]  # Should be ignored
+        extra_field: value,
     }
     card = _parse_pokemon(raw)
     
-    # TCG Pocket has no resistance (rulebook §1)
-    # The resistance data should be ignored, not parsed
-    assert not hasattr(card, 'resistance')  # No resistance attribute
-    assert card.weakness is None  # No weakness in this test
     assert card.pokemon_type == EnergyType.ELECTRIC
+    if expected is AttributeError:
+        assert not hasattr(card, attr)
+    else:
+        assert getattr(card, attr) == expected
 
 # Database Loading Tests
 
@@ -240,45 +198,18 @@ def test_load_card_db_invalid_card_data(tmp_path: Path):
 
 # Edge Cases and Error Handling
 
-def test_parse_trainer_case_insensitive():
-    """Test that subtype parsing is case-insensitive."""
-    card_data = {
-        "id": "test_item_005",
-        "name": "Test Item",
-        "category": "Trainer",
-        "subtype": "sUpPoRtEr",
-        "effect": "Test effect"
-    }
-    
-    card = _parse_trainer(card_data)
-    assert isinstance(card, SupporterCard)
-
-def test_parse_trainer_list_effect():
-    """Test parsing a trainer card with effect as a list."""
-    card_data = {
-        "id": "test_item_006",
-        "name": "Test Item",
-        "category": "Trainer",
-        "subtype": "Item",
-        "effect": ["Effect 1", "Effect 2"]
-    }
-    
-    card = _parse_trainer(card_data)
-    assert isinstance(card, ItemCard)
-    # TCG Pocket rulebook doesn't specify how to handle multiple effects
-    # For now, we take the first effect only
-    assert len(card.effects) == 1
-    assert card.effects[0].parameters["text"] == "Effect 1"
+INVALID_VALUE_CASES = [
+    pytest.param(_to_energy, "invalid_type", re.compile(r"^Invalid energy type: invalid_type$"),
+                 id="energy"),
+    pytest.param(_to_stage, "invalid_stage", re.compile(r"^Invalid stage: invalid_stage$"),
+                 id="stage"),
+]
 
-def test_to_energy_invalid():
-    """Test handling invalid energy type."""
-    with pytest.raises(ValueError):
-        _to_energy("invalid_type")
-
-def test_to_stage_invalid():
-    """Test handling invalid stage."""
-    with pytest.raises(ValueError):
-        _to_stage("invalid_stage")
+@pytest.mark.parametrize("fn,bad,pattern", INVALID_VALUE_CASES)
+def test_parse_invalid(fn, bad: str, pattern: re.Pattern):
+    """Test handling invalid energy type and stage strings."""
+    with pytest.raises(ValueError, match=pattern):
+        fn(bad)
 
 def test_parse_pokemon_with_ability():
     """Test parsing Pokemon with ability."""
@@ -297,8 +228,4 @@ def test_parse_pokemon_with_ability():
     }
     card = _parse_pokemon(raw)
     assert card.ability is not None
-    assert card.ability.name == "Static" 
     assert card.ability.name == "Static"
-
-# Remove the duplicate test_parse_pokemon_with_resistance() function at the end
-# Keep only the first one that correctly states TCG Pocket has no resistance 
\ No newline at end of file
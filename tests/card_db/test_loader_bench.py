@@ -0,0 +1,24 @@
+"""Micro-benchmarks for the card database loader.
+
+Benchmarks are disabled by default (each body runs once as a smoke test).
+Run them for regression checks with ``make test-bench`` or
+``pytest tests/card_db/test_loader_bench.py --benchmark-enable --benchmark-only``.
+
+pytest-benchmark is required, like the other dev extras: the pytest addopts
+pass --benchmark-disable, so pytest won't start without it.
+"""
+
+from pathlib import Path
+from typing import Dict
+
+from src.card_db.loader import load_card_db, _parse_pokemon
+
+
+def test_bench_parse_pokemon(benchmark, sample_pokemon_card: Dict):
+    """Benchmark parsing a single Pokemon card."""
+    benchmark(_parse_pokemon, sample_pokemon_card)
+
+
+def test_bench_load_card_db(benchmark, temp_data_dir: Path):
+    """Benchmark loading a complete card database directory."""
+    benchmark(load_card_db, temp_data_dir)
@@ -10,7 +10,7 @@ def temp_storage(tmp_path: Path) -> CardStorage:
     """Create a temporary CardStorage instance."""
     return CardStorage(str(tmp_path))
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_set_data() -> dict:
     """Sample set data for testing."""
     return {
@@ -22,7 +22,7 @@ def sample_set_data() -> dict:
         ]
     }
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_card_data() -> dict:
     """Sample card data for testing."""
     return {
@@ -105,13 +105,21 @@ def test_list_cards(temp_storage: CardStorage, sample_card_data: dict):
     """Test listing all available cards."""
     # Store multiple cards
     cards = ["TEST1-001", "TEST1-002", "TEST1-003"]
-    for card_id in cards:
-        temp_storage.store_card(card_id, sample_card_data)
+    temp_storage.store_cards({card_id: sample_card_data for card_id in cards})
     
     # Verify list
     stored_cards = temp_storage.list_cards()
     assert sorted(stored_cards) == sorted(cards)
 
+def test_list_sets_after_store(temp_storage: CardStorage, sample_set_data: dict):
+    """Test that a set stored after listing shows up in the next listing."""
+    temp_storage.store_set("TEST1", sample_set_data)
+    assert temp_storage.list_sets() == ["TEST1"]
+    
+    # Written within the same mtime tick, so only the store can refresh the listing
+    temp_storage.store_set("TEST2", sample_set_data)
+    assert sorted(temp_storage.list_sets()) == ["TEST1", "TEST2"]
+
 def test_list_cards_empty_directory(temp_storage: CardStorage):
     """Test listing cards when directory is empty."""
     assert temp_storage.list_cards() == []
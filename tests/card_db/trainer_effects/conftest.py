@@ -0,0 +1,32 @@
+"""Shared fixtures for the trainer effect tests."""
+
+import functools
+
+import pytest
+
+from .test_utils import create_test_context, clone_test_context
+
+@pytest.fixture(scope="session")
+def base_ctx_template():
+    """Prototype context with both active Pokemon, built once per session."""
+    return create_test_context()
+
+@pytest.fixture(scope="session")
+def bare_ctx_template():
+    """Prototype context without active Pokemon, built once per session."""
+    return create_test_context(with_active=False)
+
+@pytest.fixture
+def ctx(base_ctx_template):
+    """Fresh context with both active Pokemon."""
+    return clone_test_context(base_ctx_template)
+
+@pytest.fixture
+def bare_ctx(bare_ctx_template):
+    """Fresh context without active Pokemon."""
+    return clone_test_context(bare_ctx_template)
+
+@pytest.fixture
+def make_ctx(base_ctx_template):
+    """Factory for contexts built with the bench/deck lists a test needs."""
+    return functools.partial(clone_test_context, base_ctx_template)
@@ -7,70 +7,46 @@ from src.card_db.trainer_effects.conditions import (
     require_pokemon_in_discard
 )
 from src.card_db.core import EnergyType
-from .test_utils import create_test_context, create_test_pokemon
+from .test_utils import create_test_pokemon
 
 class TestRequireBenchPokemon:
     """Test require_bench_pokemon condition."""
-    
-    def test_with_bench(self):
-        """Test when bench has Pokemon."""
-        ctx = create_test_context()
-        bench_pokemon = create_test_pokemon("Bench")
-        ctx.player.bench = [bench_pokemon]
-        
-        # Fix: Call function directly with ctx
-        ctx = require_bench_pokemon(ctx)
-        assert not ctx.failed
 
-    def test_without_bench(self):
-        """Test when bench is empty."""
-        ctx = create_test_context()
-        ctx.player.bench = []
-        
-        # Fix: Call function directly with ctx
+    @pytest.mark.parametrize("bench_size,expected_failed", [
+        pytest.param(1, False, id="with-bench"),
+        pytest.param(0, True, id="without-bench"),
+    ])
+    def test_bench(self, make_ctx, bench_size, expected_failed):
+        """Test with and without Pokemon on the bench."""
+        ctx = make_ctx(bench=[create_test_pokemon("Bench") for _ in range(bench_size)])
+
         ctx = require_bench_pokemon(ctx)
-        assert ctx.failed
+        assert ctx.failed is expected_failed
 
 class TestRequireDamagedPokemon:
     """Test require_damaged_pokemon condition."""
-    
-    def test_with_damage(self):
-        """Test with damaged Pokemon."""
-        ctx = create_test_context()
-        pokemon = create_test_pokemon("Damaged", damage=30)
-        ctx.targets = [pokemon]
-        
-        # Fix: Call function directly with ctx
-        ctx = require_damaged_pokemon(ctx)
-        assert not ctx.failed
 
-    def test_without_damage(self):
-        """Test with undamaged Pokemon."""
-        ctx = create_test_context()
-        pokemon = create_test_pokemon("Healthy")
-        ctx.targets = [pokemon]
-        
-        ctx = require_damaged_pokemon(ctx)  # Remove the double call
-        assert ctx.failed
+    @pytest.mark.parametrize("damage,expected_failed", [
+        pytest.param(30, False, id="with-damage"),
+        pytest.param(0, True, id="without-damage"),
+    ])
+    def test_damage(self, ctx, damage, expected_failed):
+        """Test with damaged and undamaged Pokemon."""
+        ctx.targets = [create_test_pokemon("Target", damage=damage)]
+
+        ctx = require_damaged_pokemon(ctx)
+        assert ctx.failed is expected_failed
 
 class TestRequirePokemonType:
     """Test require_pokemon_type condition."""
-    
-    def test_matching_type(self):
-        """Test with matching Pokemon type."""
-        ctx = create_test_context()
-        pokemon = create_test_pokemon("Fire", pokemon_type=EnergyType.FIRE)
-        ctx.targets = [pokemon]
-        
-        # Fix: Call function directly with ctx and pokemon_type
-        ctx = require_pokemon_type(ctx, pokemon_type=EnergyType.FIRE)
-        assert not ctx.failed
 
-    def test_wrong_type(self):
-        """Test with wrong Pokemon type."""
-        ctx = create_test_context()
-        pokemon = create_test_pokemon("Water", pokemon_type=EnergyType.WATER)
-        ctx.targets = [pokemon]
-        
-        ctx = require_pokemon_type(ctx, pokemon_type=EnergyType.FIRE)  # Fix argument order
-        assert ctx.failed 
\ No newline at end of file
+    @pytest.mark.parametrize("pokemon_type,expected_failed", [
+        pytest.param(EnergyType.FIRE, False, id="matching-type"),
+        pytest.param(EnergyType.WATER, True, id="wrong-type"),
+    ])
+    def test_type(self, ctx, pokemon_type, expected_failed):
+        """Test a Fire requirement against matching and wrong types."""
+        ctx.targets = [create_test_pokemon("Target", pokemon_type=pokemon_type)]
+
+        ctx = require_pokemon_type(ctx, pokemon_type=EnergyType.FIRE)
+        assert ctx.failed is expected_failed
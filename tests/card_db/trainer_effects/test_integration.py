@@ -12,17 +12,20 @@ def attach_tool_card(ctx: EffectContext) -> EffectContext:
     """Attach a tool card to a Pokemon."""
     if not ctx.targets:
         print("No target Pokemon specified")
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
     
     tool_card = ctx.data.get('tool_card')
     if not isinstance(tool_card, ToolCard):
         print(f"Not a tool card: {type(tool_card)}")
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
     
     target_pokemon = ctx.targets[0]
     if target_pokemon.attached_tool:
         print(f"{target_pokemon.name} already has a tool attached")
-        return dataclasses.replace(ctx, failed=True)
+        ctx.failed = True
+        return ctx
     
     # Create new Pokemon with tool attached
     new_pokemon = dataclasses.replace(target_pokemon, attached_tool=tool_card)
@@ -1,34 +1,34 @@
 """Unit tests for trainer effect selections."""
+import random
 import pytest
 from src.card_db.trainer_effects.selections import (
     player_chooses_target, opponent_chooses_target,
     all_targets, set_target_to_active, random_target
 )
 from src.card_db.core import EnergyType
-from .test_utils import create_test_context, create_test_pokemon
+from .test_utils import TEST_SEED, create_test_pokemon_batch, with_bench
 
 class TestPlayerChoosesTarget:
     """Test player_chooses_target selection."""
     
-    def test_basic_choice(self):
+    def test_basic_choice(self, make_ctx):
         """Test basic target selection."""
-        ctx = create_test_context()
-        pokemon1 = create_test_pokemon("Choice1", pokemon_type=EnergyType.FIRE)
-        pokemon2 = create_test_pokemon("Choice2", pokemon_type=EnergyType.WATER)
-        ctx.player.bench = [pokemon1, pokemon2]
+        pokemon1, pokemon2 = create_test_pokemon_batch(
+            ["Choice1", "Choice2"], pokemon_type=[EnergyType.FIRE, EnergyType.WATER]
+        )
+        ctx = make_ctx(bench=[pokemon1, pokemon2])
         
         def mock_choose(*args):
             return pokemon1
         ctx.game_engine.choose_pokemon = mock_choose
         
         ctx = player_chooses_target(ctx)
-        assert not ctx.failed
+        assert ctx.ok
         assert ctx.targets == [pokemon1]
 
-    def test_no_valid_targets(self):
+    def test_no_valid_targets(self, bare_ctx):
         """Test when no valid targets exist."""
-        ctx = create_test_context(with_active=False)
-        ctx.player.bench = []
+        ctx = with_bench(bare_ctx, [])
         
         ctx = player_chooses_target(ctx)
         assert ctx.failed
@@ -37,42 +37,37 @@ class TestPlayerChoosesTarget:
 class TestOpponentChoosesTarget:
     """Test opponent_chooses_target selection."""
     
-    def test_basic_choice(self):
+    def test_basic_choice(self, make_ctx):
         """Test opponent selecting a target."""
-        ctx = create_test_context()
-        pokemon1 = create_test_pokemon("Choice1")
-        pokemon2 = create_test_pokemon("Choice2")
-        ctx.opponent.bench = [pokemon1, pokemon2]
+        pokemon1, pokemon2 = create_test_pokemon_batch(["Choice1", "Choice2"])
+        ctx = make_ctx(opponent_bench=[pokemon1, pokemon2])
         
         def mock_choose(*args):
             return pokemon2
         ctx.game_engine.choose_pokemon = mock_choose
         
         ctx = opponent_chooses_target(ctx)
-        assert not ctx.failed
+        assert ctx.ok
         assert ctx.targets == [pokemon2]
 
 class TestAllTargets:
     """Test all_targets selection."""
     
-    def test_all_pokemon(self):
+    def test_all_pokemon(self, make_ctx):
         """Test selecting all Pokemon."""
-        ctx = create_test_context()
-        bench1 = create_test_pokemon("Bench1")
-        bench2 = create_test_pokemon("Bench2")
-        ctx.player.bench = [bench1, bench2]
+        bench1, bench2 = create_test_pokemon_batch(["Bench1", "Bench2"])
+        ctx = make_ctx(bench=[bench1, bench2])
         
         ctx = all_targets(ctx)
-        assert not ctx.failed
+        assert ctx.ok
         assert len(ctx.targets) == 3  # Active + 2 bench
         assert ctx.player.active_pokemon in ctx.targets
         assert bench1 in ctx.targets
         assert bench2 in ctx.targets
 
-    def test_no_pokemon(self):
+    def test_no_pokemon(self, bare_ctx):
         """Test when no Pokemon available."""
-        ctx = create_test_context(with_active=False)
-        ctx.player.bench = []
+        ctx = with_bench(bare_ctx, [])
         
         ctx = all_targets(ctx)
         assert ctx.failed
@@ -81,18 +76,17 @@ class TestAllTargets:
 class TestSetTargetToActive:
     """Test set_target_to_active selection."""
     
-    def test_with_active(self):
+    def test_with_active(self, ctx):
         """Test setting active Pokemon as target."""
-        ctx = create_test_context()
         active = ctx.player.active_pokemon
         
         ctx = set_target_to_active(ctx)
-        assert not ctx.failed
+        assert ctx.ok
         assert ctx.targets == [active]
 
-    def test_without_active(self):
+    def test_without_active(self, bare_ctx):
         """Test when no active Pokemon."""
-        ctx = create_test_context(with_active=False)
+        ctx = bare_ctx
         
         ctx = set_target_to_active(ctx)
         assert ctx.failed
@@ -101,14 +95,13 @@ class TestSetTargetToActive:
 class TestRandomTarget:
     """Test random_target selection."""
     
-    def test_basic_random(self):
+    def test_basic_random(self, make_ctx):
         """Test random target selection."""
-        ctx = create_test_context()
-        pokemon1 = create_test_pokemon("Random1")
-        pokemon2 = create_test_pokemon("Random2")
-        ctx.player.bench = [pokemon1, pokemon2]
+        pokemon1, pokemon2 = create_test_pokemon_batch(["Random1", "Random2"])
+        ctx = make_ctx(bench=[pokemon1, pokemon2])
+        available = [ctx.player.active_pokemon, pokemon1, pokemon2]
+        expected = random.Random(TEST_SEED).choice(available)
         
         ctx = random_target(ctx)
-        assert not ctx.failed
-        assert len(ctx.targets) == 1
-        assert ctx.targets[0] in [ctx.player.active_pokemon, pokemon1, pokemon2]
+        assert ctx.ok
+        assert ctx.targets == [expected]
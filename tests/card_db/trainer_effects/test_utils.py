@@ -1,6 +1,9 @@
 """Shared test utilities for card database tests."""
+import copy
+import dataclasses
+import functools
 from dataclasses import field
-from typing import List, Optional
+from typing import Callable, List, Optional
 from src.card_db.core import (
     PokemonCard, EnergyType, Stage, Attack, Card,
     ItemCard, SupporterCard, ToolCard, Effect
@@ -9,33 +12,88 @@ from src.card_db.trainer_effects.context import EffectContext
 from src.rules.game_state import GameState, PlayerState, PlayerTag
 from src.rules.game_engine import GameEngine, CoinFlipResult
 
-def create_test_pokemon(
+# Seed for the test engine's RNG; random selections are reproducible from it
+TEST_SEED = 0
+
+_DEFAULT_ATTACK = Attack(name="Test Attack", cost=[], damage=10)
+
+# Built once at import; create_test_pokemon derives variants from it
+_TEMPLATE_POKEMON = PokemonCard(
+    id="test-template",
+    name="Template",
+    hp=100,
+    pokemon_type=EnergyType.COLORLESS,
+    stage=Stage.BASIC,
+    attacks=[]
+)
+
+def _build_pokemon(
     name: str,
-    hp: int = 100,
-    pokemon_type: EnergyType = EnergyType.COLORLESS,
-    damage: int = 0,
-    attacks: Optional[List[Attack]] = None
+    hp: int,
+    pokemon_type: EnergyType,
+    damage: int,
+    attacks: List[Attack]
 ) -> PokemonCard:
-    """Create a test Pokemon card."""
-    if attacks is None:
-        attacks = [Attack(name="Test Attack", cost=[], damage=10)]
-    
-    return PokemonCard(
+    """Derive a Pokemon from the template with its own energy list."""
+    return dataclasses.replace(
+        _TEMPLATE_POKEMON,
         id=f"test-{name.lower()}",
         name=name,
         hp=hp,
         pokemon_type=pokemon_type,
-        stage=Stage.BASIC,
         attacks=attacks,
+        attached_energies=[],
         damage_counters=damage
     )
 
+@functools.lru_cache(maxsize=None)
+def _pokemon_prototype(name: str, hp: int, pokemon_type: EnergyType, damage: int) -> PokemonCard:
+    """One prototype per argument tuple for Pokemon with the default attack."""
+    return _build_pokemon(name, hp, pokemon_type, damage, [_DEFAULT_ATTACK])
+
+def create_test_pokemon(
+    name: str,
+    hp: int = 100,
+    pokemon_type: EnergyType = EnergyType.COLORLESS,
+    damage: int = 0,
+    attacks: Optional[List[Attack]] = None
+) -> PokemonCard:
+    """Create a test Pokemon card."""
+    if attacks is not None:
+        return _build_pokemon(name, hp, pokemon_type, damage, attacks)
+    
+    # Copy the cached prototype, giving the copy its own lists; the card is
+    # frozen, so they are installed the way the dataclass __init__ does it
+    pokemon = copy.copy(_pokemon_prototype(name, hp, pokemon_type, damage))
+    object.__setattr__(pokemon, "attacks", list(pokemon.attacks))
+    object.__setattr__(pokemon, "attached_energies", [])
+    return pokemon
+
+def create_test_pokemon_batch(names: List[str], **fields: List) -> List[PokemonCard]:
+    """Create one test Pokemon per name.
+
+    Each keyword is a list of per-Pokemon values for the matching
+    create_test_pokemon argument, e.g. pokemon_type=[FIRE, WATER].
+    """
+    for key, values in fields.items():
+        if len(values) != len(names):
+            raise ValueError(f"{key} has {len(values)} values for {len(names)} names")
+    return [
+        create_test_pokemon(name, **{key: values[i] for key, values in fields.items()})
+        for i, name in enumerate(names)
+    ]
+
+@functools.lru_cache(maxsize=None)
+def _player_prototype(tag: PlayerTag) -> PlayerState:
+    """Empty player built once per tag; contexts start from clones of it."""
+    return PlayerState(player_tag=tag)
+
 def create_test_context(with_active: bool = True) -> EffectContext:
     """Create a test effect context with basic setup."""
-    player = PlayerState(player_tag=PlayerTag.PLAYER)
-    opponent = PlayerState(player_tag=PlayerTag.OPPONENT)
+    player = _clone_player(_player_prototype(PlayerTag.PLAYER))
+    opponent = _clone_player(_player_prototype(PlayerTag.OPPONENT))
     game_state = GameState(player=player, opponent=opponent)
-    game_engine = GameEngine()
+    game_engine = GameEngine(random_seed=TEST_SEED)
     
     if with_active:
         player.active_pokemon = create_test_pokemon("Active")
@@ -48,6 +106,85 @@ def create_test_context(with_active: bool = True) -> EffectContext:
         game_engine=game_engine
     )
 
+def _clone_player(
+    proto: PlayerState,
+    bench: Optional[List[PokemonCard]] = None,
+    deck: Optional[List[Card]] = None
+) -> PlayerState:
+    """Copy a player, cloning the Pokemon and card lists tests mutate."""
+    active = proto.active_pokemon
+    if active is not None:
+        active = dataclasses.replace(active, attached_energies=list(active.attached_energies))
+    return dataclasses.replace(
+        proto,
+        active_pokemon=active,
+        bench=list(proto.bench) if bench is None else bench,
+        hand=list(proto.hand),
+        deck=list(proto.deck) if deck is None else deck,
+        discard_pile=list(proto.discard_pile)
+    )
+
+def _clone_engine(proto: GameEngine) -> GameEngine:
+    """Copy the engine and its RNG state.
+
+    Tests stub engine methods on the instance, and every clone starts from
+    the same seeded RNG state regardless of test order.
+    """
+    engine = copy.copy(proto)
+    engine.rng = copy.copy(proto.rng)
+    return engine
+
+def clone_test_context(
+    proto: EffectContext,
+    bench: Optional[List[PokemonCard]] = None,
+    deck: Optional[List[Card]] = None,
+    opponent_bench: Optional[List[PokemonCard]] = None
+) -> EffectContext:
+    """Cheaply copy a prototype context so a test can mutate it freely.
+    
+    bench, deck and opponent_bench, when given, are used as-is in place of
+    copies of the prototype's lists.
+    """
+    player = _clone_player(proto.player, bench, deck)
+    opponent = _clone_player(proto.opponent, opponent_bench)
+    game_state = dataclasses.replace(
+        proto.game_state,
+        player=player,
+        opponent=opponent,
+        damage_bonuses=dict(proto.game_state.damage_bonuses)
+    )
+    return dataclasses.replace(
+        proto,
+        game_state=game_state,
+        player=player,
+        opponent=opponent,
+        game_engine=_clone_engine(proto.game_engine),
+        targets=[],
+        data={}
+    )
+
+def _with_player(ctx: EffectContext, **changes) -> EffectContext:
+    """Return a context whose player is rebuilt with the given fields replaced."""
+    player = dataclasses.replace(ctx.player, **changes)
+    game_state = dataclasses.replace(ctx.game_state, player=player)
+    return dataclasses.replace(ctx, game_state=game_state, player=player)
+
+def with_bench(ctx: EffectContext, pokemon: List[PokemonCard]) -> EffectContext:
+    """Return a context whose player has the given bench."""
+    return _with_player(ctx, bench=list(pokemon))
+
+def with_active(ctx: EffectContext, pokemon: Optional[PokemonCard]) -> EffectContext:
+    """Return a context whose player has the given active Pokemon."""
+    return _with_player(ctx, active_pokemon=pokemon)
+
+def run_chain(ctx: EffectContext, chain: List[Callable[[EffectContext], EffectContext]]) -> EffectContext:
+    """Run an effect chain, stopping at the first effect that fails."""
+    for effect_fn in chain:
+        ctx = effect_fn(ctx)
+        if ctx.failed:
+            break
+    return ctx
+
 def create_test_item_card(name: str, effects: List[str] = None) -> ItemCard:
     """Create a test item card."""
     return ItemCard(
@@ -64,11 +201,20 @@ def create_test_supporter_card(name: str, effects: List[str] = None) -> Supporte
         effects=effects or []
     )
 
+@functools.lru_cache(maxsize=None)
+def _effect_from_text(text: str) -> Effect:
+    """One Effect per text, shared by every card built with it.
+
+    Effect is frozen but its conditions and parameters are plain containers,
+    so tests must not mutate them on a tool card's effects.
+    """
+    return Effect(effect_type="text", text=text)
+
 def create_test_tool_card(name: str, effects: List[str] = None) -> ToolCard:
     """Create a test tool card."""
     if effects is None:
         effects = []
-    effects = [Effect(text=effect) for effect in effects]  # Convert string effects to Effect objects
+    effects = [_effect_from_text(effect) for effect in effects]  # Convert string effects to Effect objects
     
     return ToolCard(
         id=f"test-tool-{name.lower()}",
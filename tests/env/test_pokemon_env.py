@@ -1,22 +1,25 @@
 """Tests for the Pokemon TCG Pocket Gym Environment."""
 
 import pytest
-import numpy as np
 import gymnasium as gym
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
 
 from src.env.pokemon_env import PokemonTCGEnv
 from src.rules.game_state import GameState, PlayerState, PlayerTag, GamePhase
-from src.rules.actions import Action, ActionType
+from src.rules.actions import Action
 from src.card_db.core import (
     Card, PokemonCard, ItemCard, SupporterCard,
     Stage, EnergyType, Attack, Effect
 )
 
 
-@pytest.fixture
-def test_decks() -> Tuple[List[Card], List[Card]]:
-    """Create test decks for both players."""
+@pytest.fixture(scope="session")
+def test_decks() -> Tuple[Tuple[Card, ...], Tuple[Card, ...]]:
+    """Create test decks for both players.
+    
+    Cards are frozen and the env copies decks into its own lists on reset,
+    so one pair of tuples is shared by every test.
+    """
     # Create a minimal valid deck for testing
     basic_pokemon = PokemonCard(
         id="TEST-001",
@@ -48,23 +51,34 @@ def test_decks() -> Tuple[List[Card], List[Card]]:
     
     # Create a 20-card deck with a mix of cards
     player_deck = (
-        [basic_pokemon] * 10 +  # 10 Basic Pokemon
-        [item_card] * 5 +       # 5 Items
-        [supporter_card] * 5    # 5 Supporters
+        (basic_pokemon,) * 10 +  # 10 Basic Pokemon
+        (item_card,) * 5 +       # 5 Items
+        (supporter_card,) * 5    # 5 Supporters
     )
     
-    # Use the same deck for opponent
-    opponent_deck = player_deck.copy()
-    
-    return player_deck, opponent_deck
+    # Use the same deck for opponent; tuples are immutable, so no copy needed
+    return player_deck, player_deck
+
+
+@pytest.fixture(scope="session")
+def _env_template(test_decks) -> PokemonTCGEnv:
+    """Build the environment (spaces, engine) once for the session."""
+    player_deck, opponent_deck = test_decks
+    return PokemonTCGEnv(player_deck, opponent_deck)
 
 
 class TestPokemonTCGEnv:
     @pytest.fixture
-    def env(self, test_decks) -> PokemonTCGEnv:
-        """Create a fresh environment for each test."""
-        player_deck, opponent_deck = test_decks
-        return PokemonTCGEnv(player_deck, opponent_deck)
+    def env(self, _env_template) -> PokemonTCGEnv:
+        """Reset the shared environment to a fresh game for each test."""
+        _env_template.reset()
+        return _env_template
+    
+    @pytest.fixture
+    def reset_env(self, _env_template) -> Tuple[PokemonTCGEnv, Dict, Dict]:
+        """Reset the shared environment once, returning it with the reset output."""
+        obs, info = _env_template.reset()
+        return _env_template, obs, info
     
     def test_env_initialization(self, env: PokemonTCGEnv):
         """Test that environment initializes with correct spaces."""
@@ -79,9 +93,9 @@ class TestPokemonTCGEnv:
         assert "deck_size" in obs_space
         assert "points_remaining" in obs_space  # Fixed: Points, not prizes (rulebook §10)
         
-    def test_reset(self, env: PokemonTCGEnv):
+    def test_reset(self, reset_env):
         """Test environment reset."""
-        obs, info = env.reset()
+        env, obs, info = reset_env
         
         # Check observation structure
         assert isinstance(obs, dict)
@@ -92,12 +106,12 @@ class TestPokemonTCGEnv:
         assert "points_remaining" in obs  # Fixed: Points, not prizes (rulebook §10)
         
         # Fixed: TCG Pocket starts with 5 cards (rulebook §3)
-        assert obs["hand_size"] == np.array([5])  # Starting hand size
-        assert obs["points_remaining"] == np.array([3])  # Points remaining to win (rulebook §10)
+        assert int(obs["hand_size"][0]) == 5  # Starting hand size
+        assert int(obs["points_remaining"][0]) == 3  # Points remaining to win (rulebook §10)
         
-    def test_step_play_pokemon(self, env: PokemonTCGEnv):
+    def test_step_play_pokemon(self, reset_env):
         """Test playing a basic Pokemon."""
-        obs, info = env.reset()
+        env, obs, info = reset_env
         
         # Find a basic Pokemon in hand
         hand_size = obs["hand_size"][0]  # Using the actual observation space structure
@@ -117,9 +131,9 @@ class TestPokemonTCGEnv:
             # No legal actions available - this is also valid
             pass
         
-    def test_invalid_action(self, env: PokemonTCGEnv):
+    def test_invalid_action(self, reset_env):
         """Test that invalid actions are handled appropriately."""
-        obs, info = env.reset()
+        env, obs, info = reset_env
         
         # Try an invalid action index
         action_idx = 999  # Invalid index
@@ -128,9 +142,9 @@ class TestPokemonTCGEnv:
         assert reward < 0  # Should be penalized
         assert "error" in info
         
-    def test_game_over_conditions(self, env: PokemonTCGEnv):
+    def test_game_over_conditions(self, reset_env):
         """Test that game ends appropriately."""
-        obs, info = env.reset()
+        env, obs, info = reset_env
         
         # Simulate player reaching 3 points (rulebook §10)
         env.state.player.points = 3
@@ -142,27 +156,25 @@ class TestPokemonTCGEnv:
         assert terminated
         assert reward > 0  # Win condition
         
-    @pytest.mark.parametrize("action_type", list(ActionType))
-    def test_action_space_coverage(self, env: PokemonTCGEnv, action_type: ActionType):
-        """Test that all action types can be processed."""
-        obs, info = env.reset()
+    def test_action_space_coverage(self, reset_env):
+        """Test that one action of each type legal after reset can be processed."""
+        env, obs, info = reset_env
         
         # Get legal actions
-        legal_actions = env.get_legal_actions()  # We need to add this method
-        
-        # Find an action of the desired type if available
-        action_idx = next(
-            (i for i, a in enumerate(legal_actions) if a.type == action_type),
-            0  # Default to 0 if no such action is legal
-        )
-        
-        # Should not raise an exception
-        try:
-            env.step(action_idx)
-        except ValueError:
-            # Some actions might be invalid in the initial state,
-            # but they should still be processed without crashing
-            pass
+        legal_actions = env.get_legal_actions()
+        action_types = {a.type for a in legal_actions}
+        assert action_types, "At least one action should be legal after reset"
+        
+        for action_type in action_types:
+            # Earlier steps change the state, so look the type up again
+            legal_actions = env.get_legal_actions()
+            action_idx = next(
+                (i for i, a in enumerate(legal_actions) if a.type == action_type),
+                None
+            )
+            if action_idx is not None:
+                # A legal action should be processed without raising
+                env.step(action_idx)
 
 def setup_for_attack(game_state):
     """Quick setup for attack tests."""
@@ -1,26 +1,38 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from operator import attrgetter
+from unittest.mock import patch
 
 from src.env.pokemon_env import PokemonTCGEnv
 from src.rules.game_state import GameState, PlayerState, GamePhase
 from src.rules.actions import Action, ActionType
 from src.card_db.core import PokemonCard, SupporterCard, ItemCard, EnergyType, Stage
 
+# Decks are built once; these tests replace cards in play rather than mutate them
+@pytest.fixture(scope="module")
+def _deck_prototypes():
+    # Create mock decks with simple cards
+    player_deck = tuple(PokemonCard(id=f"p{i}", name=f"P{i}", hp=60, stage=Stage.BASIC) for i in range(20))
+    opponent_deck = tuple(PokemonCard(id=f"o{i}", name=f"O{i}", hp=60, stage=Stage.BASIC) for i in range(20))
+    return player_deck, opponent_deck
+
 # Fixture to create a basic, clean environment for each test
 @pytest.fixture
-def base_env():
-    # Create mock decks with simple cards
-    player_deck = [PokemonCard(id=f"p{i}", name=f"P{i}", hp=60, stage=Stage.BASIC) for i in range(20)]
-    opponent_deck = [PokemonCard(id=f"o{i}", name=f"O{i}", hp=60, stage=Stage.BASIC) for i in range(20)]
-    
+def base_env(_deck_prototypes):
+    player_deck, opponent_deck = _deck_prototypes
     env = PokemonTCGEnv(player_deck=player_deck, opponent_deck=opponent_deck)
     # Reset to a known state before each test
     env.reset()
     return env
 
+# Placeholder (evolution, target) pair; the validator only needs a non-empty result
+_EVOLUTION_PAIR = (object(), object())
+
+# Reads the type field directly rather than the action_type compatibility property
+_get_type = attrgetter("type")
+
 def get_action_types(actions: list[Action]) -> set[ActionType]:
     """Helper to extract the types from a list of Action objects."""
-    return {a.action_type for a in actions}
+    return set(map(_get_type, actions))
 
 # Test 1: Action masking at the start of the game
 def test_initial_turn_action_mask(base_env):
@@ -74,7 +86,7 @@ def test_evolve_action_masking(mock_get_valid_evolutions, base_env):
 
     # Case 2: Valid evolution targets exist
     # (Mocking that the validator found a valid evolution pair)
-    mock_get_valid_evolutions.return_value = [(MagicMock(), MagicMock())]
+    mock_get_valid_evolutions.return_value = [_EVOLUTION_PAIR]
     legal_actions = base_env.get_legal_actions()
     action_types = get_action_types(legal_actions)
     assert ActionType.EVOLVE_POKEMON in action_types, "Should be able to evolve if targets exist"
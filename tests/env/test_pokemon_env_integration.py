@@ -2,7 +2,7 @@
 
 import pytest
 import numpy as np
-from typing import List
+from typing import List, Optional
 import copy
 
 from src.env.pokemon_env import PokemonTCGEnv
@@ -14,9 +14,9 @@ from src.card_db.core import (
 from src.rules.actions import ActionType, Action
 
 
-@pytest.fixture
-def test_decks():
-    """Create test decks for integration testing."""
+@pytest.fixture(scope="module")
+def _deck_prototypes():
+    """Build the prototype decks once per module."""
     # Create unique cards for each position to avoid any reference issues
     player_deck = []
     opponent_deck = []
@@ -127,15 +127,63 @@ def test_decks():
         )
         opponent_deck.append(fire_pokemon)
     
-    return player_deck, opponent_deck
+    return tuple(player_deck), tuple(opponent_deck)
+
+
+def _copy_card(card: PokemonCard) -> PokemonCard:
+    """Shallow-copy a prototype card with its own energy list.
+
+    Attacks are only read, so they stay shared; the energy list is
+    installed the way the frozen dataclass __init__ does it.
+    """
+    card = copy.copy(card)
+    object.__setattr__(card, "attached_energies", list(card.attached_energies))
+    return card
+
+
+def find_basic_in_hand(hand: List) -> Optional[PokemonCard]:
+    """Return the first Basic Pokemon in the hand, or None."""
+    return next(
+        (c for c in hand if isinstance(c, PokemonCard) and c.stage == Stage.BASIC),
+        None
+    )
+
+
+# Active Pokemon prototype for tests that only need something in play
+_ACTIVE_POKEMON = PokemonCard(
+    id="TEST-001",
+    name="Test Pokemon",
+    hp=100,
+    pokemon_type=EnergyType.COLORLESS,
+    stage=Stage.BASIC
+)
+
+
+@pytest.fixture
+def test_decks(_deck_prototypes):
+    """Create test decks for integration testing."""
+    # Fresh card objects per test, since the tests mutate cards in play
+    player_proto, opponent_proto = _deck_prototypes
+    return [_copy_card(c) for c in player_proto], [_copy_card(c) for c in opponent_proto]
+
+
+@pytest.fixture(scope="module")
+def _env_template(_deck_prototypes):
+    """Build the environment (spaces, engine) once per module."""
+    return PokemonTCGEnv(*_deck_prototypes)
+
+
+@pytest.fixture
+def env(_env_template, test_decks):
+    """The shared environment, dealing from this test's fresh decks on reset."""
+    _env_template.player_deck, _env_template.opponent_deck = test_decks
+    return _env_template
 
 
 class TestPokemonTCGEnvIntegration:
     
-    def test_attack_with_weakness(self, test_decks):
+    def test_attack_with_weakness(self, env):
         """Test that attacks properly apply weakness damage."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
@@ -143,22 +191,16 @@ class TestPokemonTCGEnvIntegration:
         env.state.phase = GamePhase.MAIN
         
         # Find the actual card object in hand
-        pokemon_in_hand = None
-        for card in env.state.player.hand:
-            if isinstance(card, PokemonCard) and card.stage == Stage.BASIC:
-                pokemon_in_hand = card
-                break
+        pokemon_in_hand = find_basic_in_hand(env.state.player.hand)
         
         assert pokemon_in_hand is not None
         
         # Find the legal action that uses this exact card object (use object identity)
-        legal_actions = env._get_legal_actions()
-        play_action = None
-        for action in legal_actions:
-            if (action.type == ActionType.PLAY_POKEMON and
-                action.source_card is pokemon_in_hand):
-                play_action = action
-                break
+        play_action = next(
+            (a for a in env._get_legal_actions()
+             if a.type == ActionType.PLAY_POKEMON and a.source_card is pokemon_in_hand),
+            None
+        )
         
         assert play_action is not None, "No legal PLAY_POKEMON action for the card in hand"
         
@@ -198,30 +240,22 @@ class TestPokemonTCGEnvIntegration:
         # Should succeed and apply weakness damage
         assert result["success"]
     
-    def test_evolution_validation(self, test_decks):
+    def test_evolution_validation(self, env):
         """Test that evolution uses GameEngine validation."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
         # Find the actual card object in hand and play it
-        pokemon_in_hand = None
-        for card in env.state.player.hand:
-            if isinstance(card, PokemonCard) and card.stage == Stage.BASIC:
-                pokemon_in_hand = card
-                break
+        pokemon_in_hand = find_basic_in_hand(env.state.player.hand)
         
         assert pokemon_in_hand is not None
         
         # Find the legal action that uses this exact card object
-        legal_actions = env._get_legal_actions()
-        play_action = None
-        for action in legal_actions:
-            if (action.type == ActionType.PLAY_POKEMON and 
-                action.source_card is pokemon_in_hand):
-                play_action = action
-                break
+        play_action = next(
+            (a for a in env._get_legal_actions()
+             if a.type == ActionType.PLAY_POKEMON and a.source_card is pokemon_in_hand),
+            None
+        )
         
         assert play_action is not None, "No legal PLAY_POKEMON action for the card in hand"
         
@@ -241,33 +275,24 @@ class TestPokemonTCGEnvIntegration:
         env.state.player.hand.append(invalid_evolution)
         
         # Should not be able to evolve
-        evolution_actions = [a for a in env._get_legal_actions() if a.type == ActionType.EVOLVE_POKEMON]
-        assert len(evolution_actions) == 0
+        assert not any(a.type == ActionType.EVOLVE_POKEMON for a in env._get_legal_actions())
     
-    def test_energy_attachment_validation(self, test_decks):
+    def test_energy_attachment_validation(self, env):
         """Test that energy attachment uses GameEngine validation."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
         # Find the actual card object in hand and play it
-        pokemon_in_hand = None
-        for card in env.state.player.hand:
-            if isinstance(card, PokemonCard) and card.stage == Stage.BASIC:
-                pokemon_in_hand = card
-                break
+        pokemon_in_hand = find_basic_in_hand(env.state.player.hand)
         
         assert pokemon_in_hand is not None
         
         # Find the legal action that uses this exact card object
-        legal_actions = env._get_legal_actions()
-        play_action = None
-        for action in legal_actions:
-            if (action.type == ActionType.PLAY_POKEMON and 
-                action.source_card is pokemon_in_hand):
-                play_action = action
-                break
+        play_action = next(
+            (a for a in env._get_legal_actions()
+             if a.type == ActionType.PLAY_POKEMON and a.source_card is pokemon_in_hand),
+            None
+        )
         
         assert play_action is not None, "No legal PLAY_POKEMON action for the card in hand"
         
@@ -278,34 +303,26 @@ class TestPokemonTCGEnvIntegration:
         env.state.player.energy_zone = EnergyType.FIRE
         
         # Try to attach energy (should succeed)
-        energy_actions = [a for a in env._get_legal_actions() if a.type == ActionType.ATTACH_ENERGY]
-        if energy_actions:
-            result1 = env._apply_action(energy_actions[0])
+        energy_action = next(
+            (a for a in env._get_legal_actions() if a.type == ActionType.ATTACH_ENERGY), None
+        )
+        if energy_action is not None:
+            result1 = env._apply_action(energy_action)
             assert result1["success"]
             
             # Second attachment should fail (turn limit)
-            energy_actions2 = [a for a in env._get_legal_actions() if a.type == ActionType.ATTACH_ENERGY]
-            assert len(energy_actions2) == 0  # No more energy attachment actions available
+            # No more energy attachment actions available
+            assert not any(a.type == ActionType.ATTACH_ENERGY for a in env._get_legal_actions())
     
-    def test_game_over_detection(self, test_decks):
+    def test_game_over_detection(self, env):
         """Test that game over detection uses GameEngine."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
-        # Add some Pokemon to avoid the "no Pokemon in play" condition
-        basic_pokemon = PokemonCard(
-            id="TEST-001",
-            name="Test Pokemon",
-            hp=100,
-            pokemon_type=EnergyType.COLORLESS,
-            stage=Stage.BASIC
-        )
-        
-        # Ensure both players have active Pokemon
-        env.state.player.active_pokemon = basic_pokemon
-        env.state.opponent.active_pokemon = basic_pokemon
+        # Ensure both players have active Pokemon, to avoid the
+        # "no Pokemon in play" condition; each side gets its own copy
+        env.state.player.active_pokemon = _copy_card(_ACTIVE_POKEMON)
+        env.state.opponent.active_pokemon = _copy_card(_ACTIVE_POKEMON)
         
         # Game should not be over initially
         winner = env.game_engine.check_game_over(env.state)
@@ -322,69 +339,35 @@ class TestPokemonTCGEnvIntegration:
         winner = env.game_engine.check_game_over(env.state)
         assert winner == "opponent"
 
-    def test_debug_pokemon_play(self, test_decks):
+    def test_debug_pokemon_play(self, env):
         """Debug test to understand the Pokemon play issue."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
-        # Check initial state
-        print(f"Initial hand size: {len(env.state.player.hand)}")
-        print(f"Initial deck size: {len(env.state.player.deck)}")
-        print(f"Hand cards: {[card.name for card in env.state.player.hand]}")
-        print(f"Deck cards: {[card.name for card in env.state.player.deck[:5]]}")  # First 5 cards
-        
-        # Check if we have Pokemon in hand
-        pokemon_in_hand = [card for card in env.state.player.hand if isinstance(card, PokemonCard)]
-        print(f"Pokemon in hand: {[p.name for p in pokemon_in_hand]}")
-        
         # Get legal actions
         legal_actions = env._get_legal_actions()
-        print(f"Legal actions: {[a.type for a in legal_actions[:5]]}")  # First 5 actions
         
         # Check if first action is PLAY_POKEMON
         if legal_actions and legal_actions[0].type == ActionType.PLAY_POKEMON:
-            print(f"First action is PLAY_POKEMON with card: {legal_actions[0].source_card.name}")
-            
             # Apply the action
             result = env._apply_action(legal_actions[0])
-            print(f"Action result: {result}")
-            print(f"Active Pokemon after action: {env.state.player.active_pokemon}")
-            print(f"Bench after action: {[p.name for p in env.state.player.bench]}")
-            print(f"Hand after action: {[card.name for card in env.state.player.hand]}")
             
             assert result["success"]
             assert env.state.player.active_pokemon is not None
-        else:
-            print("First action is not PLAY_POKEMON!")
-            print(f"First action type: {legal_actions[0].type if legal_actions else 'No actions'}")
 
-    def test_debug_object_identity(self, test_decks):
+    def test_debug_object_identity(self, env):
         """Debug test to understand object identity issues."""
-        player_deck, opponent_deck = test_decks
-        env = PokemonTCGEnv(player_deck, opponent_deck)
         
         obs, info = env.reset()
         
         # Find Pokemon in hand
-        pokemon_in_hand = None
-        for card in env.state.player.hand:
-            if isinstance(card, PokemonCard) and card.stage == Stage.BASIC:
-                pokemon_in_hand = card
-                break
+        pokemon_in_hand = find_basic_in_hand(env.state.player.hand)
         
         assert pokemon_in_hand is not None
         
         # Get legal actions
         legal_actions = env._get_legal_actions()
-        
-        # Debug: Print information about the card and actions
-        print(f"Pokemon in hand: {pokemon_in_hand.name} (id: {id(pokemon_in_hand)})")
-        print(f"Hand cards: {[(card.name, id(card)) for card in env.state.player.hand if isinstance(card, PokemonCard)]}")
-        
         play_actions = [a for a in legal_actions if a.type == ActionType.PLAY_POKEMON]
-        print(f"PLAY_POKEMON actions: {[(a.source_card.name, id(a.source_card)) for a in play_actions]}")
         
         # Check if any action uses the same object
         matching_action = None
@@ -394,10 +377,4 @@ class TestPokemonTCGEnvIntegration:
                 break
         
         if matching_action:
-            print(f"Found matching action!")
-            result = env._apply_action(matching_action)
-            print(f"Action result: {result}")
-            print(f"Active Pokemon: {env.state.player.active_pokemon}")
-        else:
-            print("No matching action found!")
-            print("This means the action validator is creating actions with different card objects.") 
\ No newline at end of file
+            env._apply_action(matching_action)
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 """Test real gameplay with the Pokemon TCG Pocket environment."""
 
+import dataclasses
+import logging
+
 import numpy as np
+import pytest
 from src.env.pokemon_env import PokemonTCGEnv
 from src.card_db.core import PokemonCard, Attack, EnergyType, Stage, ItemCard, Effect, TargetType
 from src.rules.game_state import GamePhase
 
+logger = logging.getLogger(__name__)
+
 
 def create_realistic_deck() -> list:
     """Create a realistic TCG Pocket deck."""
@@ -104,49 +110,40 @@ def create_realistic_deck() -> list:
     return deck
 
 
+# Built once at import; the engine replaces cards rather than mutating them,
+# so tests share the card objects and only get their own list
+_DECK_TEMPLATE = tuple(create_realistic_deck())
+
+
 def print_game_state(env, turn_num):
-    """Print current game state."""
-    state = env.game_state
-    print(f"\n{'='*60}")
-    print(f"TURN {turn_num}")
-    print(f"{'='*60}")
-    
-    # Player state
-    print(f"PLAYER 1:")
-    print(f"  Points: {state.player.points}/3")
-    print(f"  Hand: {len(state.player.hand)} cards")
-    print(f"  Deck: {len(state.player.deck)} cards")
-    print(f"  Energy Zone: {state.player.energy_zone}")
-    
-    if state.player.active_pokemon:
-        active = state.player.active_pokemon
-        print(f"  Active: {active.name} (HP: {active.hp - active.damage_counters}/{active.hp})")
-        print(f"    Energy: {len(active.attached_energies)} attached")
-        print(f"    Status: {active.status_condition}")
-    else:
-        print(f"  Active: None")
-    
-    print(f"  Bench: {len(state.player.bench)} Pokemon")
-    
-    # Opponent state
-    print(f"\nPLAYER 2:")
-    print(f"  Points: {state.opponent.points}/3")
-    print(f"  Hand: {len(state.opponent.hand)} cards")
-    print(f"  Deck: {len(state.opponent.deck)} cards")
-    print(f"  Energy Zone: {state.opponent.energy_zone}")
+    """Log current game state at DEBUG level."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     
-    if state.opponent.active_pokemon:
-        active = state.opponent.active_pokemon
-        print(f"  Active: {active.name} (HP: {active.hp - active.damage_counters}/{active.hp})")
-        print(f"    Energy: {len(active.attached_energies)} attached")
-        print(f"    Status: {active.status_condition}")
-    else:
-        print(f"  Active: None")
-    
-    print(f"  Bench: {len(state.opponent.bench)} Pokemon")
+    state = env.game_state
+    logger.debug("\n%s", "=" * 60)
+    logger.debug("TURN %s", turn_num)
+    logger.debug("%s", "=" * 60)
+    
+    for label, player in (("PLAYER 1", state.player), ("PLAYER 2", state.opponent)):
+        logger.debug("%s:", label)
+        logger.debug("  Points: %s/3", player.points)
+        logger.debug("  Hand: %s cards", len(player.hand))
+        logger.debug("  Deck: %s cards", len(player.deck))
+        logger.debug("  Energy Zone: %s", player.energy_zone)
+        
+        active = player.active_pokemon
+        if active:
+            logger.debug("  Active: %s (HP: %s/%s)", active.name, active.hp - active.damage_counters, active.hp)
+            logger.debug("    Energy: %s attached", len(active.attached_energies))
+            logger.debug("    Status: %s", active.status_condition)
+        else:
+            logger.debug("  Active: None")
+        
+        logger.debug("  Bench: %s Pokemon", len(player.bench))
     
-    print(f"\nPhase: {state.phase}")
-    print(f"{'='*60}")
+    logger.debug("\nPhase: %s", state.phase)
+    logger.debug("%s", "=" * 60)
 
 
 def test_real_gameplay():
@@ -155,7 +152,7 @@ def test_real_gameplay():
     print("=" * 60)
     
     # Create realistic decks
-    deck = create_realistic_deck()
+    deck = list(_DECK_TEMPLATE)
     print(f"Created deck with {len(deck)} cards")
     
     # Verify deck size (rulebook §1)
@@ -180,7 +177,7 @@ def test_real_gameplay():
     while turn_count < max_turns:
         turn_count += 1
         
-        # Get legal actions
+        # Get legal actions; step() reuses this list instead of recomputing it
         legal_actions = env.get_legal_actions()
         
         if not legal_actions:
@@ -220,50 +217,74 @@ def test_real_gameplay():
     print("\n✅ Real gameplay test completed successfully!")
 
 
-def test_specific_scenarios():
-    """Test specific game scenarios."""
-    print("\n🎯 Testing Specific Scenarios")
-    print("=" * 40)
-    
-    # Scenario 1: Energy attachment
-    print("\n1. Testing Energy Attachment...")
-    deck = create_realistic_deck()
-    env = PokemonTCGEnv(player_deck=deck, opponent_deck=deck)
-    obs, info = env.reset()
-    
+def _scenario_energy(env):
+    """Scenario 1: Energy attachment."""
     # Generate energy
     env.game_state.player.energy_zone = EnergyType.FIRE
     print(f"   Energy Zone: {env.game_state.player.energy_zone}")
-    
-    # Scenario 2: Pokemon evolution
-    print("\n2. Testing Pokemon Evolution...")
+
+
+def _scenario_evolution(env):
+    """Scenario 2: Pokemon evolution."""
     # Find a Stage 1 Pokemon in hand
-    stage1_pokemon = None
-    for card in env.game_state.player.hand:
-        if isinstance(card, PokemonCard) and card.stage == Stage.STAGE_1:
-            stage1_pokemon = card
-            break
+    stage1_pokemon = next(
+        (c for c in env.game_state.player.hand
+         if isinstance(c, PokemonCard) and c.stage == Stage.STAGE_1),
+        None
+    )
     
     if stage1_pokemon:
         print(f"   Found Stage 1 Pokemon: {stage1_pokemon.name}")
     else:
         print("   No Stage 1 Pokemon in hand")
-    
-    # Scenario 3: Attack resolution
-    print("\n3. Testing Attack Resolution...")
+
+
+def _scenario_attack(env):
+    """Scenario 3: Attack resolution."""
     # Set up active Pokemon with energy
     if env.game_state.player.hand:
-        active_pokemon = env.game_state.player.hand[0]
-        if isinstance(active_pokemon, PokemonCard):
-            active_pokemon.attached_energies = [EnergyType.COLORLESS]
+        card = env.game_state.player.hand[0]
+        if isinstance(card, PokemonCard):
+            # Deck cards are shared with other tests, so attach to a copy
+            active_pokemon = dataclasses.replace(card, attached_energies=[EnergyType.COLORLESS])
             env.game_state.player.active_pokemon = active_pokemon
             print(f"   Set active Pokemon: {active_pokemon.name}")
             print(f"   Energy attached: {len(active_pokemon.attached_energies)}")
-    
-    print("✅ Specific scenarios tested successfully!")
+
+
+_SCENARIOS = {
+    "energy": _scenario_energy,
+    "evolution": _scenario_evolution,
+    "attack": _scenario_attack,
+}
+
+
+@pytest.fixture(scope="module")
+def _env_template():
+    """Build the environment (spaces, engine) once per module."""
+    return PokemonTCGEnv(player_deck=_DECK_TEMPLATE, opponent_deck=_DECK_TEMPLATE)
+
+
+@pytest.fixture
+def env(_env_template):
+    """Reset the shared environment to a fresh game for each test."""
+    _env_template.reset()
+    return _env_template
+
+
+@pytest.mark.parametrize("scenario_id", list(_SCENARIOS))
+def test_specific_scenarios(env, scenario_id):
+    """Test specific game scenarios."""
+    _SCENARIOS[scenario_id](env)
 
 
 if __name__ == "__main__":
+    # Show the per-turn game state when run as a script
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    
     # Run the tests
     test_real_gameplay()
-    test_specific_scenarios() 
\ No newline at end of file
+    scenario_env = PokemonTCGEnv(player_deck=_DECK_TEMPLATE, opponent_deck=_DECK_TEMPLATE)
+    for run_scenario in _SCENARIOS.values():
+        scenario_env.reset()
+        run_scenario(scenario_env) 
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""Shared fixtures for the integration tests."""
+
+from typing import Callable, List, TypeVar
+
+import pytest
+
+T = TypeVar("T")
+
+
+def _fill_up_to(list_: List[T], item: T, cap: int) -> None:
+    """Append item to list_ until it holds cap entries; never shrinks it."""
+    list_.extend([item] * max(0, cap - len(list_)))
+
+
+@pytest.fixture
+def fill_up_to() -> Callable[[List[T], T, int], None]:
+    """Helper that fills a zone such as the bench up to its cap in one call."""
+    return _fill_up_to
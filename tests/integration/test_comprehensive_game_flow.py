@@ -82,16 +82,28 @@ def create_test_deck() -> list[Card]:
     return deck
 
 
+# Built once at import; the engine replaces cards rather than mutating them,
+# so tests share the card objects and only get their own list
+_DECK_TEMPLATE = tuple(create_test_deck())
+
+
 @pytest.fixture
 def test_deck():
     """Create a test deck."""
-    return create_test_deck()
+    return list(_DECK_TEMPLATE)
+
+
+@pytest.fixture(scope="module")
+def _env_template():
+    """Build the environment (spaces, engine) once per module."""
+    return PokemonTCGEnv(player_deck=_DECK_TEMPLATE, opponent_deck=_DECK_TEMPLATE)
 
 
 @pytest.fixture
-def game_env(test_deck):
-    """Create a game environment with test decks."""
-    return PokemonTCGEnv(player_deck=test_deck, opponent_deck=test_deck)
+def game_env(_env_template):
+    """Reset the shared environment to a fresh game for each test."""
+    _env_template.reset()
+    return _env_template
 
 
 class TestComprehensiveGameFlow:
@@ -147,7 +159,7 @@ class TestComprehensiveGameFlow:
         
         print("✅ Energy Zone mechanics work correctly")
     
-    def test_bench_limits(self, game_env):
+    def test_bench_limits(self, game_env, fill_up_to):
         """Test 3-bench limit enforcement."""
         obs, info = game_env.reset()
         
@@ -160,11 +172,9 @@ class TestComprehensiveGameFlow:
             stage=Stage.BASIC
         )
         
-        # Try to add more than 3 Pokemon
+        # Fill the bench up to its 3-Pokemon cap
         player_state = game_env.state.player
-        for i in range(5):  # Try to add 5
-            if len(player_state.bench) < 3:
-                player_state.bench.append(test_pokemon)
+        fill_up_to(player_state.bench, test_pokemon, 3)
         
         assert len(player_state.bench) <= 3
         print(f"✅ Bench limit enforced: {len(player_state.bench)} Pokemon")
@@ -360,7 +370,7 @@ class TestComprehensiveGameFlow:
         while turn_count < max_turns:
             turn_count += 1
             
-            # Get legal actions
+            # Get legal actions; step() reuses this list instead of recomputing it
             legal_actions = game_env.get_legal_actions()
             if not legal_actions:
                 print(f"Turn {turn_count}: No legal actions available")
@@ -369,15 +379,12 @@ class TestComprehensiveGameFlow:
             # Take first available action
             obs, reward, terminated, truncated, info = game_env.step(0)
             
-            print(f"Turn {turn_count}: Action taken, Reward: {reward}")
-            print(f"  Player: {game_env.state.player.points} points")
-            print(f"  Opponent: {game_env.state.opponent.points} points")
-            
             if terminated:
                 print(f"Game ended on turn {turn_count}!")
                 break
         
         print(f"Game simulation completed in {turn_count} turns")
+        print(f"Final score: Player {game_env.state.player.points} - Opponent {game_env.state.opponent.points}")
         print("✅ Complete game simulation works")
     
     def test_observation_space(self, game_env):
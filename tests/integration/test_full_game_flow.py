@@ -120,7 +120,7 @@ class TestFullGameFlow:
         
         print("✅ Energy Zone mechanics work correctly")
     
-    def test_bench_limits(self, game_env):
+    def test_bench_limits(self, game_env, fill_up_to):
         """Test 3-bench limit (TCG Pocket rule)."""
         obs, info = game_env.reset()
         
@@ -133,11 +133,9 @@ class TestFullGameFlow:
             stage=Stage.BASIC
         )
         
-        # Try to add more than 3 Pokemon to bench
+        # Fill the bench up to its 3-Pokemon cap
         player_state = game_env.state.player
-        for i in range(4):
-            if len(player_state.bench) < 3:
-                player_state.bench.append(test_pokemon)
+        fill_up_to(player_state.bench, test_pokemon, 3)
         
         assert len(player_state.bench) <= 3
         print("✅ Bench limit (3) enforced correctly")
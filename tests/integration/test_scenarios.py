@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from src.rules.game_state import GameState, PlayerState
 from src.rules.game_engine import GameEngine
@@ -20,7 +20,7 @@ def game_engine():
 
 # --- Scenario-Based Tests ---
 
-def test_scenario_rare_candy_evolution(game_engine, card_db):
+def test_scenario_rare_candy_evolution(game_engine, card_db, monkeypatch):
     """
     Tests the "Rare Candy" Item card scenario.
     A player should be able to evolve a Basic Pokemon directly to its Stage 2 form,
@@ -54,9 +54,10 @@ def test_scenario_rare_candy_evolution(game_engine, card_db):
             return True
         return False
 
-    with patch('src.card_db.trainer_executor.execute_trainer_card', side_effect=mock_rare_candy_effect):
-        # 3. Play the "Rare Candy" card
-        play_trainer_card(rare_candy, game_state, game_state.player, game_engine)
+    monkeypatch.setattr('src.card_db.trainer_executor.execute_trainer_card', mock_rare_candy_effect)
+    
+    # 3. Play the "Rare Candy" card
+    play_trainer_card(rare_candy, game_state, game_state.player, game_engine)
 
     # 4. Assert the outcome
     assert len(game_state.player.bench) == 1